@@ -17,7 +17,10 @@ Usage:
 import os
 import sys
 import argparse
+import traceback
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Add src to path
@@ -26,8 +29,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.agents import CoordinatorAgent
 
 
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from environment variables"""
+    """Load configuration from environment variables (parsed once, read-only)"""
     load_dotenv()
 
     config = {
@@ -35,10 +39,11 @@ def load_config():
         'guardian_key': os.getenv('GUARDIAN_API_KEY'),
         'similarity_threshold': float(os.getenv('SIMILARITY_THRESHOLD', '0.7')),
         'min_cluster_size': int(os.getenv('MIN_ARTICLES_PER_CLUSTER', '2')),
-        'time_period_days': int(os.getenv('ANALYSIS_LOOKBACK_DAYS', '30'))
+        'time_period_days': int(os.getenv('ANALYSIS_LOOKBACK_DAYS', '30')),
+        'cache_path': os.getenv('CACHE_PATH')
     }
 
-    return config
+    return MappingProxyType(config)
 
 
 def check_api_keys(config):
@@ -181,7 +186,6 @@ def main():
         return 1
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -1,6 +1,7 @@
+import io
 import os
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from src.agents import (
     NewsAggregatorAgent,
     EventClusteringAgent,
@@ -8,7 +9,7 @@ from src.agents import (
     PredictionAgent
 )
 from src.models import ArticleCluster, RhetoricAnalysis, EventPrediction
-from src.utils import DataStorage
+from src.utils import DataStorage, NLPProcessor
 
 
 class CoordinatorAgent:
@@ -23,22 +24,29 @@ class CoordinatorAgent:
         # Initialize storage
         self.storage = DataStorage()
 
+        # Shared NLP processor so the embedding model is loaded only once
+        self.nlp = NLPProcessor()
+
         # Initialize agents
         self.news_aggregator = NewsAggregatorAgent(
             newsapi_key=self.config.get('newsapi_key'),
-            guardian_key=self.config.get('guardian_key')
+            guardian_key=self.config.get('guardian_key'),
+            nlp=self.nlp,
+            cache_path=self.config.get('cache_path')
         )
 
         self.clusterer = EventClusteringAgent(
             similarity_threshold=self.config.get('similarity_threshold', 0.7),
-            min_cluster_size=self.config.get('min_cluster_size', 2)
+            min_cluster_size=self.config.get('min_cluster_size', 2),
+            nlp=self.nlp
         )
 
         self.rhetoric_analyzer = RhetoricAnalyzerAgent(
-            time_period_days=self.config.get('time_period_days', 30)
+            time_period_days=self.config.get('time_period_days', 30),
+            nlp=self.nlp
         )
 
-        self.predictor = PredictionAgent()
+        self.predictor = PredictionAgent(nlp=self.nlp)
 
         print("✅ CoordinatorAgent initialized with all sub-agents")
 
@@ -99,14 +107,19 @@ class CoordinatorAgent:
             print(f"   Avg articles/cluster: {stats['avg_articles_per_cluster']:.1f}")
             print(f"   Largest cluster: {stats['largest_cluster_name']} ({stats['largest_cluster_size']} articles)")
 
-        # Step 3: Analyze rhetoric for each cluster
-        print("\n📝 STEP 3: Analyzing Rhetoric for Each Event")
+        # Step 3: Analyze rhetoric and predict trajectory for each cluster
+        print("\n📝 STEP 3: Analyzing Rhetoric and Predicting Each Event")
         print("-" * 60)
         analyses = []
+        predictions = []
         for cluster in clusters:
-            analysis = self.rhetoric_analyzer.analyze_cluster(cluster)
-            analyses.append(analysis)
-            self.storage.save_analysis(analysis)
+            outcome = self._analyze_and_predict(cluster)
+            if outcome is not None:
+                analyses.append(outcome[0])
+                predictions.append(outcome[1])
+
+        if analyses:
+            self.storage.save_analyses(analyses)
 
         results['total_analyses'] = len(analyses)
 
@@ -123,14 +136,9 @@ class CoordinatorAgent:
             print(f"   Most active: {comparison['most_active']}")
             print(f"   Overall sentiment: {comparison['sentiment_summary']['interpretation']}")
 
-        # Step 4: Generate predictions
-        print("\n🔮 STEP 4: Generating Event Predictions")
+        # Step 4: Summarize predictions
+        print("\n🔮 STEP 4: Summarizing Event Predictions")
         print("-" * 60)
-        predictions = []
-        for cluster, analysis in zip(clusters, analyses):
-            prediction = self.predictor.predict_trajectory(cluster, analysis)
-            predictions.append(prediction)
-
         if predictions:
             self.storage.save_predictions(predictions)
             results['total_predictions'] = len(predictions)
@@ -153,7 +161,8 @@ class CoordinatorAgent:
         # Step 5: Generate detailed report
         print("\n📄 STEP 5: Generating Detailed Report")
         print("-" * 60)
-        report = self._generate_report(clusters, analyses, predictions)
+        clustered_articles = results.get('cluster_stats', {}).get('total_articles')
+        report = self._generate_report(clusters, analyses, predictions, clustered_articles)
         results['report'] = report
 
         print("\n" + "="*60)
@@ -162,6 +171,20 @@ class CoordinatorAgent:
 
         return results
 
+    def _analyze_and_predict(self, cluster: ArticleCluster) -> Optional[Tuple[RhetoricAnalysis, EventPrediction]]:
+        """Run rhetoric analysis and trajectory prediction for a single cluster
+
+        A failure is reported and returns None so one bad event does not
+        abort the analysis of the others.
+        """
+        try:
+            analysis = self.rhetoric_analyzer.analyze_cluster(cluster)
+            prediction = self.predictor.predict_trajectory(cluster, analysis)
+            return analysis, prediction
+        except Exception as e:
+            print(f"⚠️  Failed to analyze event '{cluster.event_name}': {e}")
+            return None
+
     def update_analysis(self, days_back: int = 1) -> Dict[str, Any]:
         """
         Update existing analysis with new articles
@@ -199,70 +222,88 @@ class CoordinatorAgent:
 
     def _generate_report(self, clusters: List[ArticleCluster],
                         analyses: List[RhetoricAnalysis],
-                        predictions: List[EventPrediction]) -> str:
+                        predictions: List[EventPrediction],
+                        total_articles: Optional[int] = None) -> str:
         """Generate a comprehensive text report"""
-        report_lines = []
+        if total_articles is None:
+            total_articles = sum(c.article_count for c in clusters)
+
+        report = io.StringIO()
 
-        report_lines.append("="*80)
-        report_lines.append("GEOPOLITICAL NEWS ANALYSIS REPORT")
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("="*80)
-        report_lines.append("")
+        def add(line: str = "") -> None:
+            report.write(line)
+            report.write("\n")
+
+        add("="*80)
+        add("GEOPOLITICAL NEWS ANALYSIS REPORT")
+        add(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        add("="*80)
+        add()
 
         # Executive Summary
-        report_lines.append("EXECUTIVE SUMMARY")
-        report_lines.append("-"*80)
-        report_lines.append(f"Total Events Analyzed: {len(clusters)}")
-        report_lines.append(f"Total Articles Processed: {sum(c.article_count for c in clusters)}")
-        report_lines.append("")
+        add("EXECUTIVE SUMMARY")
+        add("-"*80)
+        add(f"Total Events Analyzed: {len(clusters)}")
+        add(f"Total Articles Processed: {total_articles}")
+        add()
 
         # Event-by-event analysis
-        report_lines.append("DETAILED EVENT ANALYSIS")
-        report_lines.append("-"*80)
-        report_lines.append("")
+        add("DETAILED EVENT ANALYSIS")
+        add("-"*80)
+        add()
+
+        # Look up results by cluster id rather than relying on list alignment
+        analysis_by_id = {a.cluster_id: a for a in analyses}
+        prediction_by_id = {p.cluster_id: p for p in predictions}
+
+        for cluster in clusters:
+            analysis = analysis_by_id.get(cluster.id)
+            prediction = prediction_by_id.get(cluster.id)
+            if analysis is None or prediction is None:
+                continue
 
-        for cluster, analysis, prediction in zip(clusters, analyses, predictions):
-            report_lines.append(f"EVENT: {cluster.event_name}")
-            report_lines.append(f"{'='*len(cluster.event_name)}")
-            report_lines.append("")
+            add(f"EVENT: {cluster.event_name}")
+            add(f"{'='*len(cluster.event_name)}")
+            add()
 
             # Basic info
-            report_lines.append(f"Articles: {cluster.article_count}")
-            report_lines.append(f"Time Period: {cluster.first_seen.strftime('%Y-%m-%d')} to {cluster.last_updated.strftime('%Y-%m-%d')}")
-            report_lines.append(f"Keywords: {', '.join(cluster.keywords[:10])}")
-            report_lines.append("")
+            add(f"Articles: {cluster.article_count}")
+            add(f"Time Period: {cluster.first_seen.strftime('%Y-%m-%d')} to {cluster.last_updated.strftime('%Y-%m-%d')}")
+            add(f"Keywords: {', '.join(cluster.keywords[:10])}")
+            add()
 
             # Rhetoric analysis
-            report_lines.append("Rhetoric Analysis:")
-            report_lines.append(f"  Tone: {analysis.tone_shift['initial_tone']} → {analysis.tone_shift['current_tone']}")
-            report_lines.append(f"  Trend: {analysis.tone_shift['shift_direction']}")
-            report_lines.append(f"  Rhetoric Evolution: {analysis.rhetoric_evolution}")
-            report_lines.append("")
+            add("Rhetoric Analysis:")
+            add(f"  Tone: {analysis.tone_shift['initial_tone']} → {analysis.tone_shift['current_tone']}")
+            add(f"  Trend: {analysis.tone_shift['shift_direction']}")
+            add(f"  Rhetoric Evolution: {analysis.rhetoric_evolution}")
+            add()
 
             # Prediction
-            report_lines.append("Prediction:")
-            report_lines.append(f"  Trajectory: {prediction.trajectory.upper()}")
-            report_lines.append(f"  Confidence: {prediction.confidence_score:.2%}")
-            report_lines.append(f"  Short-term Outlook: {prediction.short_term_outlook}")
-            report_lines.append("")
+            add("Prediction:")
+            add(f"  Trajectory: {prediction.trajectory.upper()}")
+            add(f"  Confidence: {prediction.confidence_score:.2%}")
+            add(f"  Short-term Outlook: {prediction.short_term_outlook}")
+            add()
 
             if prediction.risk_factors:
-                report_lines.append("  Risk Factors:")
+                add("  Risk Factors:")
                 for risk in prediction.risk_factors:
-                    report_lines.append(f"    - {risk}")
-                report_lines.append("")
+                    add(f"    - {risk}")
+                add()
 
             # Key indicators
             if prediction.key_indicators:
-                report_lines.append("  Key Indicators:")
+                add("  Key Indicators:")
                 for indicator in prediction.key_indicators:
-                    report_lines.append(f"    - {indicator}")
-                report_lines.append("")
+                    add(f"    - {indicator}")
+                add()
 
-            report_lines.append("-"*80)
-            report_lines.append("")
+            add("-"*80)
+            add()
 
-        return "\n".join(report_lines)
+        # Drop the newline written after the final line
+        return report.getvalue()[:-1]
 
     def export_report(self, results: Dict[str, Any], filename: Optional[str] = None) -> str:
         """Export the analysis report to a file"""
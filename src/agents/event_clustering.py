@@ -1,9 +1,9 @@
 import hashlib
 from datetime import datetime
-from typing import List, Dict, Set
-from collections import defaultdict
+from typing import List, Dict, Set, Optional
+from collections import Counter, defaultdict
+from itertools import chain
 import numpy as np
-from sklearn.cluster import DBSCAN
 from src.models import Article, ArticleCluster
 from src.utils import NLPProcessor
 
@@ -11,10 +11,12 @@ from src.utils import NLPProcessor
 class EventClusteringAgent:
     """Agent responsible for clustering articles into events"""
 
-    def __init__(self, similarity_threshold: float = 0.7, min_cluster_size: int = 2):
+    def __init__(self, similarity_threshold: float = 0.7, min_cluster_size: int = 2,
+                 nlp: Optional[NLPProcessor] = None):
         self.similarity_threshold = similarity_threshold
         self.min_cluster_size = min_cluster_size
-        self.nlp = NLPProcessor()
+        self.nlp = nlp or NLPProcessor()
+        self.max_fallback_titles = 200
 
     def cluster_articles(self, articles: List[Article]) -> List[ArticleCluster]:
         """Cluster articles into events using semantic similarity"""
@@ -30,16 +32,22 @@ class EventClusteringAgent:
             print(f"⚠️  Not enough articles with embeddings to cluster")
             return []
 
-        # Extract embeddings
-        embeddings = np.array([a.embedding for a in articles_with_embeddings])
+        # Extract embeddings (float32 halves the matrix footprint; ample for cosine)
+        embeddings = np.array([a.embedding for a in articles_with_embeddings], dtype=np.float32)
+
+        # Use DBSCAN for clustering (imported here so runs that never cluster skip loading sklearn)
+        from sklearn.cluster import DBSCAN
 
-        # Use DBSCAN for clustering
         # eps is related to similarity threshold (1 - similarity)
         eps = 1 - self.similarity_threshold
-        clusterer = DBSCAN(eps=eps, min_samples=self.min_cluster_size, metric='cosine')
+        clusterer = DBSCAN(eps=eps, min_samples=self.min_cluster_size, metric='precomputed')
 
         try:
-            labels = clusterer.fit_predict(embeddings)
+            # Cosine distances from one normalized matrix product
+            distances = 1.0 - self.nlp.cosine_similarity_matrix(embeddings)
+            np.clip(distances, 0.0, 2.0, out=distances)
+            np.fill_diagonal(distances, 0.0)
+            labels = clusterer.fit_predict(distances)
         except Exception as e:
             print(f"❌ Error during clustering: {e}")
             return []
@@ -50,10 +58,10 @@ class EventClusteringAgent:
             if label != -1:  # -1 means noise/unclustered
                 clusters_dict[label].append(article)
 
-        # Create ArticleCluster objects
+        # Create ArticleCluster objects, reusing the stacked embedding matrix
         clusters = []
         for cluster_id, cluster_articles in clusters_dict.items():
-            cluster = self._create_cluster(cluster_id, cluster_articles)
+            cluster = self._create_cluster(cluster_id, cluster_articles, embeddings[labels == cluster_id])
             clusters.append(cluster)
 
         # Sort clusters by size (most articles first)
@@ -64,28 +72,26 @@ class EventClusteringAgent:
 
         return clusters
 
-    def _create_cluster(self, cluster_id: int, articles: List[Article]) -> ArticleCluster:
-        """Create an ArticleCluster from a list of articles"""
+    def _create_cluster(self, cluster_id: int, articles: List[Article],
+                        embeddings: Optional[np.ndarray] = None) -> ArticleCluster:
+        """Create an ArticleCluster from a list of articles
+
+        embeddings, when given, holds the articles' embeddings as matrix rows.
+        """
         # Generate unique cluster ID
         article_ids = sorted([a.id for a in articles])
-        cluster_hash = hashlib.md5(''.join(article_ids).encode()).hexdigest()[:12]
+        cluster_hash = hashlib.blake2b(''.join(article_ids).encode(), digest_size=6).hexdigest()
 
         # Calculate centroid embedding
-        embeddings = [a.embedding for a in articles if a.embedding]
-        if embeddings:
-            centroid = np.mean(embeddings, axis=0).tolist()
+        if embeddings is None:
+            embeddings = np.array([a.embedding for a in articles if a.embedding], dtype=np.float32)
+        if len(embeddings):
+            centroid = embeddings.mean(axis=0).tolist()
         else:
             centroid = None
 
-        # Extract common keywords
-        all_keywords = []
-        for article in articles:
-            all_keywords.extend(article.keywords)
-
-        # Count keyword frequencies
-        keyword_counts = defaultdict(int)
-        for keyword in all_keywords:
-            keyword_counts[keyword] += 1
+        # Count keyword frequencies (first-seen order is kept for ties)
+        keyword_counts = Counter(chain.from_iterable(a.keywords for a in articles))
 
         # Get top keywords that appear in multiple articles
         min_occurrences = max(2, len(articles) // 3)
@@ -115,53 +121,32 @@ class EventClusteringAgent:
 
     def _generate_event_name(self, articles: List[Article], keywords: List[str]) -> str:
         """Generate a descriptive name for the event cluster"""
-        # Extract entities from all titles
-        all_entities = {
-            'countries': [],
-            'leaders': [],
-            'organizations': []
-        }
+        # Extract entities from all titles in one batch
+        entities = self.nlp.extract_entities_batch([a.title for a in articles])
 
-        for article in articles:
-            entities = self.nlp.extract_entities(article.title)
-            for key in all_entities:
-                all_entities[key].extend(entities.get(key, []))
-
-        # Count entity frequencies
-        country_counts = defaultdict(int)
-        for country in all_entities['countries']:
-            country_counts[country] += 1
-
-        leader_counts = defaultdict(int)
-        for leader in all_entities['leaders']:
-            leader_counts[leader] += 1
+        # Count entity frequencies (ties keep first-seen order)
+        country_counts = Counter(chain.from_iterable(e.get('countries', []) for e in entities))
+        leader_counts = Counter(chain.from_iterable(e.get('leaders', []) for e in entities))
 
         # Build event name
         name_parts = []
 
         # Add top leaders
-        if leader_counts:
-            top_leader = max(leader_counts, key=leader_counts.get)
-            name_parts.append(top_leader.title())
+        for leader, _ in leader_counts.most_common(1):
+            name_parts.append(leader.title())
 
         # Add top countries
-        if country_counts:
-            top_countries = sorted(
-                country_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:2]
-            for country, _ in top_countries:
-                name_parts.append(country.title())
+        for country, _ in country_counts.most_common(2):
+            name_parts.append(country.title())
 
         # Add key topic keyword
         if keywords:
             name_parts.append(keywords[0])
 
         if not name_parts:
-            # Fallback: use most common words from titles
-            all_titles = ' '.join([a.title for a in articles])
-            fallback_keywords = self.nlp.extract_keywords(all_titles, top_n=3)
+            # Fallback: use most common words from titles (a sample is plenty for huge clusters)
+            titles = [a.title for a in articles[:self.max_fallback_titles]]
+            fallback_keywords = self.nlp.extract_keywords_from_texts(titles, top_n=3)
             name_parts = [kw.title() for kw in fallback_keywords[:2]]
 
         event_name = ' - '.join(name_parts) if name_parts else "Geopolitical Event"
@@ -173,34 +158,33 @@ class EventClusteringAgent:
         """Merge new articles into existing clusters or create new ones"""
         print(f"🔄 Merging {len(new_articles)} new articles into {len(old_clusters)} existing clusters...")
 
-        updated_clusters = []
         unassigned_articles = []
 
-        for article in new_articles:
-            if not article.embedding:
-                continue
-
-            # Find best matching cluster
-            best_cluster = None
-            best_similarity = 0
-
-            for cluster in old_clusters:
-                if cluster.centroid_embedding:
-                    similarity = self.nlp.cosine_similarity(
-                        article.embedding,
-                        cluster.centroid_embedding
-                    )
-
-                    if similarity > best_similarity and similarity >= self.similarity_threshold:
-                        best_similarity = similarity
-                        best_cluster = cluster
-
-            if best_cluster:
-                # Add article to existing cluster
-                best_cluster.add_article(article)
-            else:
-                # Article doesn't fit any existing cluster
-                unassigned_articles.append(article)
+        articles = [a for a in new_articles if a.embedding]
+        candidates = [c for c in old_clusters if c.centroid_embedding]
+
+        if articles and candidates:
+            # Score every article against every centroid in one matrix product;
+            # clusters keep their normalized centroid between merges
+            article_units = self.nlp.normalize_embeddings([a.embedding for a in articles])
+            centroid_units = np.stack([c.centroid_unit for c in candidates])
+            similarities = article_units @ centroid_units.T
+            best_indices = similarities.argmax(axis=1)
+            best_similarities = similarities[np.arange(len(articles)), best_indices]
+
+            assignments: Dict[int, List[Article]] = defaultdict(list)
+            for article, best_index, best_similarity in zip(articles, best_indices, best_similarities):
+                if best_similarity > 0 and best_similarity >= self.similarity_threshold:
+                    assignments[best_index].append(article)
+                else:
+                    # Article doesn't fit any existing cluster
+                    unassigned_articles.append(article)
+
+            # Add matched articles to existing clusters in one update each
+            for index, matched in assignments.items():
+                candidates[index].add_articles(matched)
+        else:
+            unassigned_articles = articles
 
         # Create new clusters from unassigned articles
         if unassigned_articles:
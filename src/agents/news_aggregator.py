@@ -1,21 +1,79 @@
+import math
 import os
+import re
 import hashlib
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from time import mktime
+from typing import List, Optional, Dict, Tuple
+from collections import defaultdict
+import numpy as np
 import requests
 import feedparser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.models import Article
-from src.utils import NLPProcessor, Translator
+from src.utils import NLPProcessor, Translator, CacheStore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import; used for every parsed entry
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Articles returned per NewsAPI request
+_NEWSAPI_PAGE_SIZE = 20
+
+# Substring keywords marking geopolitical content, matched in one regex scan
+GEOPOLITICS_KEYWORDS = [
+    'geopolit', 'diplomatic', 'diplomacy', 'international',
+    'foreign policy', 'summit', 'treaty', 'alliance',
+    'sanctions', 'trade war', 'military', 'defense',
+    'territory', 'border', 'conflict', 'war', 'peace',
+    'united nations', 'nato', 'security council',
+    'president', 'prime minister', 'government',
+    'election', 'democracy', 'authoritarian',
+    'china', 'russia', 'usa', 'europe', 'ukraine',
+    'taiwan', 'middle east', 'israel', 'iran'
+]
+# Case-insensitive so article text can be searched without a lowercased copy
+_GEOPOLITICS_RE = re.compile('|'.join(re.escape(keyword) for keyword in GEOPOLITICS_KEYWORDS), re.IGNORECASE)
 
 
 class NewsAggregatorAgent:
     """Agent responsible for aggregating news from various free sources"""
 
-    def __init__(self, newsapi_key: Optional[str] = None, guardian_key: Optional[str] = None):
+    def __init__(self, newsapi_key: Optional[str] = None, guardian_key: Optional[str] = None,
+                 nlp: Optional[NLPProcessor] = None, cache_path: Optional[str] = None):
         self.newsapi_key = newsapi_key or os.getenv('NEWSAPI_KEY')
         self.guardian_key = guardian_key or os.getenv('GUARDIAN_API_KEY')
-        self.nlp = NLPProcessor()
-        self.translator = Translator()
+        self.nlp = nlp or NLPProcessor()
+
+        # Optional on-disk cache that keeps feeds, translations, NLP results and embeddings across runs
+        self.cache = self._open_cache(cache_path)
+        self.translator = Translator(store=self.cache)
+
+        # Shared HTTP session: keep-alive connection pooling plus retries on transient errors
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=['GET'])
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Near-duplicate detection: MinHash signatures split into LSH bands, with
+        # candidates confirmed by estimated Jaccard similarity of word 3-grams
+        self.near_duplicate_threshold = 0.8
+        self.minhash_bands, self.minhash_rows = 16, 4
+        rng = np.random.default_rng(0)
+        num_perm = self.minhash_bands * self.minhash_rows
+        self._minhash_a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+        self._minhash_b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
 
         # Topics related to world order and geopolitics
         self.topics = [
@@ -66,99 +124,143 @@ class NewsAggregatorAgent:
             'RT World': 'https://www.rt.com/rss/news/',
         }
 
+    @staticmethod
+    def _open_cache(cache_path: Optional[str]) -> Optional[CacheStore]:
+        """Open the cache file if one is configured (None means no on-disk cache)"""
+        if not cache_path:
+            return None
+
+        try:
+            return CacheStore(cache_path)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Cache file unavailable ({e}); continuing without it.")
+            return None
+
     def fetch_news(self, days_back: int = 7, max_articles: int = 100) -> List[Article]:
         """Fetch news articles from all available sources"""
-        articles = []
+        # One cutoff shared by every source
+        cutoff_date = datetime.now() - timedelta(days=days_back)
 
         # Calculate distribution of articles across sources
         num_sources = 2 + len(self.rss_feeds)  # NewsAPI + Guardian + RSS feeds
         articles_per_source = max_articles // num_sources
 
+        # Sources are independent HTTP round-trips, so query them concurrently
+        sources = []
+
         print("🔍 Fetching news from NewsAPI...")
         if self.newsapi_key:
-            articles.extend(self._fetch_from_newsapi(days_back, articles_per_source))
+            sources.append(self._fetch_from_newsapi)
         else:
             print("⚠️  NewsAPI key not found. Skipping NewsAPI.")
 
         print("🔍 Fetching news from Guardian API...")
         if self.guardian_key:
-            articles.extend(self._fetch_from_guardian(days_back, articles_per_source))
+            sources.append(self._fetch_from_guardian)
         else:
             print("⚠️  Guardian API key not found. Skipping Guardian.")
 
         print(f"🌍 Fetching international news from {len(self.rss_feeds)} RSS feeds...")
-        articles.extend(self._fetch_from_rss_feeds(days_back, articles_per_source))
+        sources.append(self._fetch_from_rss_feeds)
+
+        articles = []
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [
+                executor.submit(fetch, days_back, articles_per_source, cutoff_date=cutoff_date)
+                for fetch in sources
+            ]
+            # Collect in source order so results match a sequential fetch
+            for future in futures:
+                articles.extend(future.result())
 
         # Remove duplicates based on URL
         unique_articles = self._deduplicate_articles(articles)
 
-        # Generate embeddings for articles
+        # Keyword, sentiment and embedding passes over the unique articles
+        self._enrich_articles(unique_articles)
+
         print(f"📊 Generating embeddings for {len(unique_articles)} articles...")
         self._add_embeddings(unique_articles)
 
         print(f"✅ Collected {len(unique_articles)} unique articles")
+
         return unique_articles
 
-    def _fetch_from_newsapi(self, days_back: int, max_articles: int) -> List[Article]:
+    def _fetch_from_newsapi(self, days_back: int, max_articles: int,
+                            cutoff_date: Optional[datetime] = None) -> List[Article]:
         """Fetch articles from NewsAPI"""
         if not self.newsapi_key:
             return []
 
+        cutoff_date = cutoff_date or datetime.now() - timedelta(days=days_back)
+        from_date = cutoff_date.strftime('%Y-%m-%d')
+        terms = self.search_terms[:5]  # Limit to avoid rate limits
+
+        # Terms are queried in concurrent waves of only as many requests as can still be
+        # needed to fill max_articles, so the daily request quota is spent as sparingly as
+        # a sequential loop would; results are kept in term order
         articles = []
-        base_url = "https://newsapi.org/v2/everything"
+        next_term = 0
+        with ThreadPoolExecutor(max_workers=len(terms) or 1) as executor:
+            while next_term < len(terms) and len(articles) < max_articles:
+                needed = math.ceil((max_articles - len(articles)) / _NEWSAPI_PAGE_SIZE)
+                wave = terms[next_term:next_term + needed]
+                next_term += len(wave)
 
-        from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-
-        for term in self.search_terms[:5]:  # Limit to avoid rate limits
-            try:
-                params = {
-                    'q': term,
-                    'from': from_date,
-                    'language': 'en',
-                    'sortBy': 'publishedAt',
-                    'pageSize': 20,
-                    'apiKey': self.newsapi_key
-                }
-
-                response = requests.get(base_url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                if data.get('status') == 'ok':
-                    for item in data.get('articles', []):
-                        article = self._parse_newsapi_article(item)
-                        if article:
-                            articles.append(article)
-
-                if len(articles) >= max_articles:
-                    break
-
-            except Exception as e:
-                print(f"  Error fetching from NewsAPI for '{term}': {e}")
-                continue
+                term_results = executor.map(lambda term: self._newsapi_query(term, from_date), wave)
+                articles.extend(article for term_articles in term_results for article in term_articles)
 
         return articles[:max_articles]
 
+    def _newsapi_query(self, term: str, from_date: str) -> List[Article]:
+        """Fetch and parse NewsAPI results for a single search term"""
+        articles = []
+        base_url = "https://newsapi.org/v2/everything"
+
+        try:
+            params = {
+                'q': term,
+                'from': from_date,
+                'language': 'en',
+                'sortBy': 'publishedAt',
+                'pageSize': _NEWSAPI_PAGE_SIZE,
+                'apiKey': self.newsapi_key
+            }
+
+            response = self.session.get(base_url, params=params, timeout=10)
+            response.raise_for_status()
+            data = self._json_body(response)
+
+            if data.get('status') == 'ok':
+                for item in data.get('articles', []):
+                    article = self._parse_newsapi_article(item)
+                    if article:
+                        articles.append(article)
+
+        except Exception as e:
+            print(f"  Error fetching from NewsAPI for '{term}': {e}")
+
+        return articles
+
+    @staticmethod
+    def _json_body(response: requests.Response) -> dict:
+        """Decode a JSON API response, with orjson when it is installed"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     def _parse_newsapi_article(self, item: dict) -> Optional[Article]:
         """Parse NewsAPI article format"""
         try:
             # Generate unique ID
-            article_id = hashlib.md5(
-                f"{item.get('url', '')}".encode()
-            ).hexdigest()
+            article_id = hashlib.blake2b(item.get('url', '').encode(), digest_size=16).hexdigest()
 
             # Parse published date
             published_str = item.get('publishedAt', '')
             published_at = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
 
-            # Extract keywords
             title = item.get('title', '')
             description = item.get('description', '')
-            content = f"{title} {description}"
-            keywords = self.nlp.extract_keywords(content)
-
-            # Sentiment analysis
-            sentiment = self.nlp.analyze_sentiment_simple(content)
 
             return Article(
                 id=article_id,
@@ -169,16 +271,15 @@ class NewsAggregatorAgent:
                 source=item.get('source', {}).get('name', 'NewsAPI'),
                 author=item.get('author'),
                 published_at=published_at,
-                content_snippet=item.get('content'),
-                keywords=keywords,
-                sentiment_score=sentiment
+                content_snippet=item.get('content')
             )
 
         except Exception as e:
             print(f"  Error parsing article: {e}")
             return None
 
-    def _fetch_from_guardian(self, days_back: int, max_articles: int) -> List[Article]:
+    def _fetch_from_guardian(self, days_back: int, max_articles: int,
+                             cutoff_date: Optional[datetime] = None) -> List[Article]:
         """Fetch articles from Guardian API"""
         if not self.guardian_key:
             return []
@@ -186,7 +287,8 @@ class NewsAggregatorAgent:
         articles = []
         base_url = "https://content.guardianapis.com/search"
 
-        from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        cutoff_date = cutoff_date or datetime.now() - timedelta(days=days_back)
+        from_date = cutoff_date.strftime('%Y-%m-%d')
 
         try:
             params = {
@@ -197,9 +299,9 @@ class NewsAggregatorAgent:
                 'api-key': self.guardian_key
             }
 
-            response = requests.get(base_url, params=params, timeout=10)
+            response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = self._json_body(response)
 
             if data.get('response', {}).get('status') == 'ok':
                 for item in data['response'].get('results', []):
@@ -215,9 +317,7 @@ class NewsAggregatorAgent:
     def _parse_guardian_article(self, item: dict) -> Optional[Article]:
         """Parse Guardian API article format"""
         try:
-            article_id = hashlib.md5(
-                f"{item.get('webUrl', '')}".encode()
-            ).hexdigest()
+            article_id = hashlib.blake2b(item.get('webUrl', '').encode(), digest_size=16).hexdigest()
 
             published_at = datetime.fromisoformat(
                 item.get('webPublicationDate', '').replace('Z', '+00:00')
@@ -227,10 +327,6 @@ class NewsAggregatorAgent:
             title = fields.get('headline', item.get('webTitle', ''))
             description = fields.get('trailText', '')
 
-            content = f"{title} {description}"
-            keywords = self.nlp.extract_keywords(content)
-            sentiment = self.nlp.analyze_sentiment_simple(content)
-
             return Article(
                 id=article_id,
                 title=title,
@@ -240,9 +336,7 @@ class NewsAggregatorAgent:
                 source='The Guardian',
                 author=fields.get('byline'),
                 published_at=published_at,
-                content_snippet=fields.get('bodyText', '')[:500],
-                keywords=keywords,
-                sentiment_score=sentiment
+                content_snippet=fields.get('bodyText', '')[:500]
             )
 
         except Exception as e:
@@ -251,67 +345,235 @@ class NewsAggregatorAgent:
 
     def _deduplicate_articles(self, articles: List[Article]) -> List[Article]:
         """Remove duplicate articles based on URL and title similarity"""
-        seen_urls = set()
+        # First occurrence of each URL wins (dicts keep insertion order)
+        by_url = {}
+        for article in articles:
+            by_url.setdefault(article.url, article)
+
+        # Drop syndicated copies whose titles only differ in case/punctuation
+        seen_titles = set()
+        title_unique = []
+
+        for article in by_url.values():
+            title_key = ' '.join(_PUNCTUATION_RE.sub(' ', article.title.lower()).split())
+            if title_key and title_key in seen_titles:
+                continue
+            seen_titles.add(title_key)
+            title_unique.append(article)
+
+        # Drop lightly edited copies of the same story (MinHash + LSH)
+        band_buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        signatures: List[np.ndarray] = []
         unique_articles = []
 
-        for article in articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
+        for article in title_unique:
+            signature = self._minhash_signature(f"{article.title} {article.description or ''}")
+            if signature is None:
                 unique_articles.append(article)
+                continue
+
+            bands = [
+                (band, signature[band * self.minhash_rows:(band + 1) * self.minhash_rows].tobytes())
+                for band in range(self.minhash_bands)
+            ]
+            # An earlier article sharing several bands is verified once, not once per band
+            candidates = {index for key in bands for index in band_buckets.get(key, ())}
+            if any(np.mean(signature == signatures[index]) >= self.near_duplicate_threshold
+                   for index in candidates):
+                continue
+
+            for key in bands:
+                band_buckets[key].append(len(signatures))
+            signatures.append(signature)
+            unique_articles.append(article)
 
         return unique_articles
 
+    def _minhash_signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature over the word 3-grams of text (None for empty text)"""
+        words = _PUNCTUATION_RE.sub(' ', text.lower()).split()
+        if not words:
+            return None
+
+        shingles = {' '.join(words[i:i + 3]) for i in range(max(1, len(words) - 2))}
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), 'little') for s in shingles],
+            dtype=np.uint64
+        )
+
+        # (a * h + b) mod (2^61 - 1) stays below 2^64 because a, b < 2^31 and h < 2^32
+        permuted = (np.outer(hashes, self._minhash_a) + self._minhash_b) % np.uint64((1 << 61) - 1)
+        return permuted.min(axis=0)
+
+    @staticmethod
+    def _content_key(text: str) -> str:
+        """Stable cache key for a piece of article text"""
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _enrich_articles(self, articles: List[Article]) -> None:
+        """Add keywords and sentiment to articles in one batched pass
+
+        Runs after deduplication so duplicates are never analyzed; with a
+        cache file, results for text analyzed in earlier runs are reused.
+        """
+        # A missing description must not leak in as the literal word "None"
+        contents = [f"{article.title} {article.description or ''}" for article in articles]
+        keys = [self._content_key(content) for content in contents]
+
+        stored = self.cache.get_many('nlp', keys) if self.cache else {}
+        results = {key: tuple(json.loads(meta)) for key, (meta, _) in stored.items()}
+
+        missing = {key: content for key, content in zip(keys, contents) if key not in results}
+        if missing:
+            texts = list(missing.values())
+            keywords = self.nlp.extract_keywords_batch(texts)
+            sentiments = self.nlp.analyze_sentiment_batch(texts)
+            computed = dict(zip(missing, zip(keywords, sentiments)))
+            results.update(computed)
+
+            if self.cache:
+                self.cache.put_many('nlp', {key: (json.dumps(result), None) for key, result in computed.items()})
+
+        for article, key in zip(articles, keys):
+            keywords, sentiment = results[key]
+            article.keywords = list(keywords)
+            article.sentiment_score = sentiment
+
     def _add_embeddings(self, articles: List[Article]) -> None:
-        """Add embeddings to articles"""
-        texts = []
-        for article in articles:
-            text = f"{article.title} {article.description or ''}"
-            texts.append(text)
+        """Add embeddings to articles, encoding only text not embedded in an earlier run"""
+        texts = [f"{article.title} {article.description or ''}" for article in articles]
+
+        # Keyed by model too, since embeddings from different models are not comparable
+        keys = [self._content_key(f"{self.nlp.model_name}:{text}") for text in texts]
+
+        stored = self.cache.get_many('embeddings', keys) if self.cache else {}
+        embeddings = {
+            key: np.frombuffer(data, dtype=np.float32).tolist()
+            for key, (_, data) in stored.items() if data
+        }
 
-        if texts:
-            embeddings = self.nlp.get_embeddings_batch(texts)
-            for article, embedding in zip(articles, embeddings):
-                article.embedding = embedding
+        missing = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+        if missing:
+            computed = {
+                key: embedding
+                for key, embedding in zip(missing, self.nlp.get_embeddings_batch(list(missing.values())))
+                if embedding
+            }
+            embeddings.update(computed)
+
+            if self.cache and computed:
+                self.cache.put_many('embeddings', {
+                    key: (None, np.asarray(embedding, dtype=np.float32).tobytes())
+                    for key, embedding in computed.items()
+                })
+
+        for article, key in zip(articles, keys):
+            article.embedding = embeddings.get(key, [])
 
-    def _fetch_from_rss_feeds(self, days_back: int, max_articles_per_feed: int = 10) -> List[Article]:
+    def _fetch_from_rss_feeds(self, days_back: int, max_articles_per_feed: int = 10,
+                              cutoff_date: Optional[datetime] = None) -> List[Article]:
         """Fetch articles from international RSS feeds"""
+        cutoff_date = cutoff_date or datetime.now() - timedelta(days=days_back)
+
+        if not self.rss_feeds:
+            return []
+
+        # Feeds are independent downloads, so fetch them concurrently (kept in feed order)
+        with ThreadPoolExecutor(max_workers=len(self.rss_feeds)) as executor:
+            feed_results = executor.map(
+                lambda feed: self._fetch_rss_feed(feed[0], feed[1], cutoff_date, max_articles_per_feed),
+                self.rss_feeds.items()
+            )
+            articles = [article for feed_articles in feed_results for article in feed_articles]
+
+        # Write the translations queued by all feeds in one transaction
+        self.translator.flush()
+
+        return articles
+
+    def _fetch_rss_feed(self, source_name: str, feed_url: str, cutoff_date: datetime,
+                        max_articles: int) -> List[Article]:
+        """Fetch and parse a single RSS feed
+
+        Progress lines are buffered and printed in one write when the feed is
+        done, so concurrent feeds neither interleave nor contend on stdout.
+        """
         articles = []
-        cutoff_date = datetime.now() - timedelta(days=days_back)
+        messages = [f"  Fetching from {source_name}..."]
+
+        try:
+            feed = self._parse_feed(feed_url)
 
-        for source_name, feed_url in self.rss_feeds.items():
-            try:
-                print(f"  Fetching from {source_name}...")
-                feed = feedparser.parse(feed_url)
+            if not feed.entries:
+                messages.append(f"    No entries found for {source_name}")
+                return articles
 
-                if not feed.entries:
-                    print(f"    No entries found for {source_name}")
+            for entry in feed.entries[:max_articles]:
+                try:
+                    article = self._parse_rss_article(entry, source_name, messages)
+                    if article and article.published_at >= cutoff_date:
+                        articles.append(article)
+                except Exception as e:
+                    messages.append(f"    Error parsing entry from {source_name}: {e}")
                     continue
 
-                feed_articles = 0
-                for entry in feed.entries[:max_articles_per_feed]:
-                    try:
-                        article = self._parse_rss_article(entry, source_name)
-                        if article and article.published_at >= cutoff_date:
-                            articles.append(article)
-                            feed_articles += 1
-                    except Exception as e:
-                        print(f"    Error parsing entry from {source_name}: {e}")
-                        continue
-
-                print(f"    ✓ Collected {feed_articles} articles from {source_name}")
-
-            except Exception as e:
-                print(f"    Error fetching from {source_name}: {e}")
-                continue
+            messages.append(f"    ✓ Collected {len(articles)} articles from {source_name}")
+
+        except Exception as e:
+            messages.append(f"    Error fetching from {source_name}: {e}")
+
+        finally:
+            print("\n".join(messages))
 
         return articles
 
-    def _parse_rss_article(self, entry: Dict, source_name: str) -> Optional[Article]:
-        """Parse RSS feed entry into Article object"""
+    def _parse_feed(self, feed_url: str) -> feedparser.FeedParserDict:
+        """Download and parse a feed; with a cache file, re-fetch it with a conditional GET
+
+        The feed body is stored with its ETag/Last-Modified validators, so a
+        later run that gets 304 Not Modified parses the stored copy instead.
+        """
+        if self.cache is None:
+            return feedparser.parse(feed_url)
+
+        cached = self.cache.get('feeds', feed_url)
+        validators = json.loads(cached[0]) if cached else {}
+
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('modified'):
+            headers['If-Modified-Since'] = validators['modified']
+
+        response = self.session.get(feed_url, headers=headers, timeout=15)
+        if response.status_code == 304 and cached:
+            return feedparser.parse(cached[1], response_headers=validators.get('headers'))
+        response.raise_for_status()
+
+        # feedparser reads the declared encoding from the content type
+        response_headers = {'content-type': response.headers.get('Content-Type', '')}
+        feed = feedparser.parse(response.content, response_headers=response_headers)
+
+        etag = response.headers.get('ETag')
+        modified = response.headers.get('Last-Modified')
+        if feed.entries and (etag or modified):
+            validators = {'etag': etag, 'modified': modified, 'headers': response_headers}
+            self.cache.put_many('feeds', {feed_url: (json.dumps(validators), response.content)})
+
+        return feed
+
+    def _parse_rss_article(self, entry: Dict, source_name: str,
+                           messages: Optional[List[str]] = None) -> Optional[Article]:
+        """Parse RSS feed entry into Article object
+
+        Progress and errors are appended to messages when given, else printed.
+        """
+        emit = messages.append if messages is not None else print
+
         try:
             # Generate unique ID
             url = entry.get('link', entry.get('id', ''))
-            article_id = hashlib.md5(url.encode()).hexdigest()
+            article_id = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
             # Extract title and description
             title = entry.get('title', '')
@@ -319,40 +581,28 @@ class NewsAggregatorAgent:
 
             # Clean HTML tags from description if present
             if description:
-                import re
-                description = re.sub(r'<[^>]+>', '', description)
-                description = description[:500]  # Limit length
+                description = _HTML_TAG_RE.sub('', description)[:500]  # Limit length
+
+            # Check relevance before any translation or NLP work; names such as
+            # China, NATO, Ukraine or Iran read the same in most source languages
+            if not self._is_geopolitics_related(f"{title} {description}"):
+                return None
 
             # Translate if needed
             if title and not self.translator.is_english(title):
-                print(f"    Translating from {source_name}...")
-                title = self.translator.translate_to_english(title)
-                if description:
-                    description = self.translator.translate_to_english(description)
+                emit(f"    Translating from {source_name}...")
+                title, description = self.translator.translate_many([title, description])
 
             # Parse published date
             published_at = None
             if 'published_parsed' in entry and entry.published_parsed:
-                from time import mktime
                 published_at = datetime.fromtimestamp(mktime(entry.published_parsed))
             elif 'updated_parsed' in entry and entry.updated_parsed:
-                from time import mktime
                 published_at = datetime.fromtimestamp(mktime(entry.updated_parsed))
             else:
                 # Default to current time if no date available
                 published_at = datetime.now()
 
-            # Extract content
-            content = f"{title} {description}"
-
-            # Check if article is relevant to geopolitics
-            if not self._is_geopolitics_related(content):
-                return None
-
-            # Extract keywords and sentiment
-            keywords = self.nlp.extract_keywords(content)
-            sentiment = self.nlp.analyze_sentiment_simple(content)
-
             # Get author if available
             author = entry.get('author', None)
 
@@ -365,13 +615,11 @@ class NewsAggregatorAgent:
                 source=source_name,
                 author=author,
                 published_at=published_at,
-                content_snippet=description[:300] if description else None,
-                keywords=keywords,
-                sentiment_score=sentiment
+                content_snippet=description[:300] if description else None
             )
 
         except Exception as e:
-            print(f"    Error parsing RSS article: {e}")
+            emit(f"    Error parsing RSS article: {e}")
             return None
 
     def _is_geopolitics_related(self, text: str) -> bool:
@@ -379,19 +627,5 @@ class NewsAggregatorAgent:
         if not text:
             return False
 
-        text_lower = text.lower()
-
         # Check if any topic keywords are present
-        geopolitics_keywords = [
-            'geopolit', 'diplomatic', 'diplomacy', 'international',
-            'foreign policy', 'summit', 'treaty', 'alliance',
-            'sanctions', 'trade war', 'military', 'defense',
-            'territory', 'border', 'conflict', 'war', 'peace',
-            'united nations', 'nato', 'security council',
-            'president', 'prime minister', 'government',
-            'election', 'democracy', 'authoritarian',
-            'china', 'russia', 'usa', 'europe', 'ukraine',
-            'taiwan', 'middle east', 'israel', 'iran'
-        ]
-
-        return any(keyword in text_lower for keyword in geopolitics_keywords)
+        return _GEOPOLITICS_RE.search(text) is not None
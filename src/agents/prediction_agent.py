@@ -1,15 +1,50 @@
+import heapq
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from collections import Counter
 import numpy as np
 from src.models import ArticleCluster, RhetoricAnalysis, EventPrediction
 from src.utils import NLPProcessor
 
 
+# Static outlook texts by trajectory; anything unrecognized reads as 'stable'
+SHORT_TERM_OUTLOOKS = {
+    'escalating': (
+        "Short-term outlook (7 days): Situation likely to intensify. "
+        "Expect increased media coverage, possible diplomatic statements, "
+        "and heightened rhetoric. Monitor for concrete actions matching the rhetoric."
+    ),
+    'de-escalating': (
+        "Short-term outlook (7 days): Situation showing signs of stabilization. "
+        "Expect continued dialogue, reduced inflammatory rhetoric, "
+        "and possible diplomatic progress."
+    ),
+    'stable': (
+        "Short-term outlook (7 days): Situation expected to remain stable. "
+        "Continue monitoring for any sudden changes in rhetoric or actions."
+    ),
+}
+
+# The escalating medium-term outlook depends on the urgency level and is built per analysis
+MEDIUM_TERM_OUTLOOKS = {
+    'de-escalating': (
+        "Medium-term outlook (30 days): If current trends continue, "
+        "the situation should move toward resolution or at least stabilization. "
+        "Watch for formal agreements or continued positive signals."
+    ),
+    'stable': (
+        "Medium-term outlook (30 days): Situation likely to remain in current state "
+        "unless external factors intervene. Monitor for any catalyst events "
+        "that could shift the trajectory."
+    ),
+}
+
+
 class PredictionAgent:
     """Agent responsible for predicting event trajectories and outcomes"""
 
-    def __init__(self):
-        self.nlp = NLPProcessor()
+    def __init__(self, nlp: Optional[NLPProcessor] = None):
+        self.nlp = nlp or NLPProcessor()
 
         # Historical patterns for reference
         self.escalation_patterns = [
@@ -78,39 +113,40 @@ class PredictionAgent:
             'stable': 0
         }
 
-        # Analyze sentiment trend
-        if analysis.sentiment_trend:
+        # Analyze sentiment trend (a slope needs at least two points)
+        if len(analysis.sentiment_trend) >= 2:
             recent_sentiments = [
                 s['sentiment_score']
                 for s in analysis.sentiment_trend[-5:]
             ]
 
-            if len(recent_sentiments) >= 2:
-                # Calculate trend
-                x = np.arange(len(recent_sentiments))
-                y = np.array(recent_sentiments)
-                trend = np.polyfit(x, y, 1)[0]
+            # Least-squares slope over x = 0..n-1 in closed form (no polyfit/LAPACK)
+            y = np.asarray(recent_sentiments, dtype=float)
+            n = y.size
+            trend = float(((np.arange(n) - (n - 1) / 2) * y).sum() / (n * (n * n - 1) / 12))
 
-                if trend < -0.05:
-                    scores['escalating'] += 2
-                elif trend > 0.05:
-                    scores['de-escalating'] += 2
-                else:
-                    scores['stable'] += 1
+            if trend < -0.05:
+                scores['escalating'] += 2
+            elif trend > 0.05:
+                scores['de-escalating'] += 2
+            else:
+                scores['stable'] += 1
 
         # Analyze tone shift
         tone_shift = analysis.tone_shift
-        if tone_shift['shift_direction'] == 'deteriorating':
+        shift_direction = tone_shift['shift_direction']
+        if shift_direction == 'deteriorating':
             scores['escalating'] += 2
-        elif tone_shift['shift_direction'] == 'improving':
+        elif shift_direction == 'improving':
             scores['de-escalating'] += 2
         else:
             scores['stable'] += 1
 
         # Urgency indicators
-        if len(analysis.urgency_indicators) > 5:
+        urgency_count = len(analysis.urgency_indicators)
+        if urgency_count > 5:
             scores['escalating'] += 1
-        elif len(analysis.urgency_indicators) < 2:
+        elif urgency_count < 2:
             scores['de-escalating'] += 1
 
         # Urgency change
@@ -162,8 +198,8 @@ class PredictionAgent:
             consistency_confidence = max(0, 1.0 - sentiment_std)
             confidence_factors.append(consistency_confidence)
 
-        # Overall confidence is average of factors
-        return float(np.mean(confidence_factors))
+        # Overall confidence is average of factors (plain arithmetic; at most four scalars)
+        return float(sum(confidence_factors) / len(confidence_factors))
 
     def _extract_key_indicators(self, analysis: RhetoricAnalysis) -> List[str]:
         """Extract key indicators supporting the prediction"""
@@ -198,23 +234,25 @@ class PredictionAgent:
                                analysis: RhetoricAnalysis) -> List[str]:
         """Find similar historical patterns"""
         patterns = []
+        phrases = [kp['phrase'].lower() for kp in analysis.key_phrases]
+        tone_shift = analysis.tone_shift
 
         if trajectory == 'escalating':
             # Check for specific escalation patterns
-            if 'military' in str(analysis.key_phrases).lower():
+            if any('military' in phrase for phrase in phrases):
                 patterns.append("Military rhetoric escalation (similar to pre-conflict situations)")
 
-            if any('sanction' in kw for kw in analysis.tone_shift.get('new_keywords', [])):
+            if any('sanction' in kw for kw in tone_shift.get('new_keywords', [])):
                 patterns.append("Economic sanctions pattern (similar to trade war scenarios)")
 
             if len(analysis.urgency_indicators) > 5:
                 patterns.append("High urgency pattern (similar to crisis situations)")
 
         elif trajectory == 'de-escalating':
-            if 'dialogue' in str(analysis.key_phrases).lower() or 'talk' in str(analysis.key_phrases).lower():
+            if any('dialogue' in phrase or 'talk' in phrase for phrase in phrases):
                 patterns.append("Diplomatic engagement pattern (similar to resolution scenarios)")
 
-            if analysis.tone_shift['shift_direction'] == 'improving':
+            if tone_shift['shift_direction'] == 'improving':
                 patterns.append("Improving tone pattern (similar to post-crisis recovery)")
 
         else:  # stable
@@ -225,23 +263,7 @@ class PredictionAgent:
     def _generate_short_term_outlook(self, trajectory: str,
                                      analysis: RhetoricAnalysis) -> str:
         """Generate 7-day outlook"""
-        if trajectory == 'escalating':
-            return (
-                "Short-term outlook (7 days): Situation likely to intensify. "
-                "Expect increased media coverage, possible diplomatic statements, "
-                "and heightened rhetoric. Monitor for concrete actions matching the rhetoric."
-            )
-        elif trajectory == 'de-escalating':
-            return (
-                "Short-term outlook (7 days): Situation showing signs of stabilization. "
-                "Expect continued dialogue, reduced inflammatory rhetoric, "
-                "and possible diplomatic progress."
-            )
-        else:
-            return (
-                "Short-term outlook (7 days): Situation expected to remain stable. "
-                "Continue monitoring for any sudden changes in rhetoric or actions."
-            )
+        return SHORT_TERM_OUTLOOKS.get(trajectory, SHORT_TERM_OUTLOOKS['stable'])
 
     def _generate_medium_term_outlook(self, trajectory: str,
                                       analysis: RhetoricAnalysis) -> str:
@@ -254,18 +276,8 @@ class PredictionAgent:
                 f"Key factors to watch: actor responses, international involvement, "
                 f"and whether rhetoric translates to concrete actions."
             )
-        elif trajectory == 'de-escalating':
-            return (
-                "Medium-term outlook (30 days): If current trends continue, "
-                "the situation should move toward resolution or at least stabilization. "
-                "Watch for formal agreements or continued positive signals."
-            )
-        else:
-            return (
-                "Medium-term outlook (30 days): Situation likely to remain in current state "
-                "unless external factors intervene. Monitor for any catalyst events "
-                "that could shift the trajectory."
-            )
+
+        return MEDIUM_TERM_OUTLOOKS.get(trajectory, MEDIUM_TERM_OUTLOOKS['stable'])
 
     def _identify_risk_factors(self, cluster: ArticleCluster,
                                analysis: RhetoricAnalysis) -> List[str]:
@@ -285,10 +297,8 @@ class PredictionAgent:
 
         # Negative sentiment
         if analysis.sentiment_trend:
-            recent_sentiment = np.mean([
-                s['sentiment_score']
-                for s in analysis.sentiment_trend[-5:]
-            ])
+            recent_sentiments = [s['sentiment_score'] for s in analysis.sentiment_trend[-5:]]
+            recent_sentiment = sum(recent_sentiments) / len(recent_sentiments)
             if recent_sentiment < -0.3:
                 risk_factors.append("Persistently negative sentiment indicates deep tensions")
 
@@ -299,8 +309,9 @@ class PredictionAgent:
 
         # Specific risk keywords
         risk_keywords = ['military', 'invasion', 'war', 'weapon', 'strike', 'attack']
-        all_keywords = [kp['phrase'] for kp in analysis.key_phrases]
-        found_risk_keywords = [kw for kw in risk_keywords if any(kw in phrase for phrase in all_keywords)]
+        # Phrases are joined with spaces, so a single-word keyword cannot match across two of them
+        all_phrases = ' '.join(kp['phrase'] for kp in analysis.key_phrases)
+        found_risk_keywords = [kw for kw in risk_keywords if kw in all_phrases]
 
         if found_risk_keywords:
             risk_factors.append(f"Presence of high-risk keywords: {', '.join(found_risk_keywords)}")
@@ -309,24 +320,24 @@ class PredictionAgent:
 
     def _calculate_attention_metrics(self, cluster: ArticleCluster) -> Dict[str, Any]:
         """Calculate metrics about attention and coverage"""
-        # Sort by date
-        sorted_articles = sorted(cluster.articles, key=lambda a: a.published_at)
+        articles = cluster.articles
 
-        # Calculate coverage intensity
-        if sorted_articles:
-            time_span = (sorted_articles[-1].published_at - sorted_articles[0].published_at).days
+        # Calculate coverage intensity; only the date range is needed, not a full sort
+        if articles:
+            dates = [a.published_at for a in articles]
+            time_span = (max(dates) - min(dates)).days
             intensity = cluster.article_count / max(1, time_span)
         else:
             intensity = 0
 
         # Source diversity
-        sources = set(a.source for a in cluster.articles)
+        sources = set(a.source for a in articles)
 
         # Coverage trend
-        if len(sorted_articles) >= 4:
-            mid = len(sorted_articles) // 2
+        if len(articles) >= 4:
+            mid = len(articles) // 2
             early_count = mid
-            recent_count = len(sorted_articles) - mid
+            recent_count = len(articles) - mid
 
             if recent_count > early_count * 1.5:
                 trend = 'increasing'
@@ -350,25 +361,24 @@ class PredictionAgent:
         if not predictions:
             return {'status': 'no_predictions'}
 
+        trajectory_counts = Counter(p.trajectory for p in predictions)
         escalating = [p for p in predictions if p.trajectory == 'escalating']
-        de_escalating = [p for p in predictions if p.trajectory == 'de-escalating']
-        stable = [p for p in predictions if p.trajectory == 'stable']
 
         # Find highest confidence predictions
-        top_predictions = sorted(predictions, key=lambda p: p.confidence_score, reverse=True)[:3]
+        top_predictions = heapq.nlargest(3, predictions, key=lambda p: p.confidence_score)
 
         # Find most concerning
-        most_concerning = sorted(
+        most_concerning = heapq.nlargest(
+            3,
             escalating,
-            key=lambda p: (len(p.risk_factors), p.confidence_score),
-            reverse=True
-        )[:3]
+            key=lambda p: (len(p.risk_factors), p.confidence_score)
+        )
 
         return {
             'total_events': len(predictions),
-            'escalating_count': len(escalating),
-            'de_escalating_count': len(de_escalating),
-            'stable_count': len(stable),
+            'escalating_count': trajectory_counts['escalating'],
+            'de_escalating_count': trajectory_counts['de-escalating'],
+            'stable_count': trajectory_counts['stable'],
             'top_confidence_predictions': [
                 {'event': p.event_name, 'confidence': p.confidence_score, 'trajectory': p.trajectory}
                 for p in top_predictions
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+from itertools import chain
 import numpy as np
 from src.models import Article, ArticleCluster, RhetoricAnalysis
 from src.utils import NLPProcessor
@@ -9,9 +10,13 @@ from src.utils import NLPProcessor
 class RhetoricAnalyzerAgent:
     """Agent responsible for analyzing rhetoric and language patterns over time"""
 
-    def __init__(self, time_period_days: int = 30):
+    def __init__(self, time_period_days: int = 30, nlp: Optional[NLPProcessor] = None):
         self.time_period_days = time_period_days
-        self.nlp = NLPProcessor()
+        self.nlp = nlp or NLPProcessor()
+
+        # Per-article NLP results, shared by analysis and cross-cluster comparison
+        self._urgency_cache: Dict[str, Tuple[str, ...]] = {}
+        self._entity_cache: Dict[str, Dict[str, List[str]]] = {}
 
     def analyze_cluster(self, cluster: ArticleCluster) -> RhetoricAnalysis:
         """Perform comprehensive rhetoric analysis on a cluster"""
@@ -20,20 +25,23 @@ class RhetoricAnalyzerAgent:
         # Sort articles by date
         sorted_articles = sorted(cluster.articles, key=lambda a: a.published_at)
 
+        # Article texts are built once and shared by every text-based step
+        texts = self._article_texts(sorted_articles)
+
         # Analyze sentiment trend over time
         sentiment_trend = self._analyze_sentiment_trend(sorted_articles)
 
         # Extract and analyze key phrases over time
-        key_phrases = self._analyze_key_phrases(sorted_articles)
+        key_phrases = self._analyze_key_phrases(texts)
 
         # Detect tone shifts
-        tone_shift = self._analyze_tone_shift(sorted_articles)
+        tone_shift = self._analyze_tone_shift(sorted_articles, texts)
 
         # Find urgency indicators
-        urgency_indicators = self._find_urgency_indicators(sorted_articles)
+        urgency_indicators = self._find_urgency_indicators(texts)
 
         # Track actor mentions
-        actor_mentions = self._track_actor_mentions(sorted_articles)
+        actor_mentions = self._track_actor_mentions(texts)
 
         # Analyze linguistic features
         linguistic_features = self._analyze_linguistic_features(sorted_articles)
@@ -62,35 +70,30 @@ class RhetoricAnalyzerAgent:
 
     def _analyze_sentiment_trend(self, articles: List[Article]) -> List[Dict[str, Any]]:
         """Analyze how sentiment changes over time"""
-        trend = []
-
-        for article in articles:
-            if article.sentiment_score is not None:
-                trend.append({
-                    'date': article.published_at.isoformat(),
-                    'sentiment_score': article.sentiment_score,
-                    'title': article.title[:50]
-                })
-
-        return trend
+        return [
+            {
+                'date': article.published_at.isoformat(),
+                'sentiment_score': article.sentiment_score,
+                'title': article.title[:50]
+            }
+            for article in articles
+            if article.sentiment_score is not None
+        ]
 
-    def _analyze_key_phrases(self, articles: List[Article]) -> List[Dict[str, Any]]:
+    def _analyze_key_phrases(self, texts: List[str]) -> List[Dict[str, Any]]:
         """Analyze key phrases and their evolution over time"""
-        # Split articles into time periods
-        if len(articles) < 4:
-            periods = [articles]
+        # Split article texts into time periods
+        if len(texts) < 4:
+            periods = [texts]
         else:
-            mid_point = len(articles) // 2
-            periods = [articles[:mid_point], articles[mid_point:]]
+            mid_point = len(texts) // 2
+            periods = [texts[:mid_point], texts[mid_point:]]
 
         phrase_analysis = []
 
-        for i, period_articles in enumerate(periods):
+        for i, period_texts in enumerate(periods):
             # Combine all text from period
-            period_text = ' '.join([
-                f"{a.title} {a.description or ''}"
-                for a in period_articles
-            ])
+            period_text = ' '.join(period_texts)
 
             # Extract phrases
             phrases = self.nlp.extract_phrases(period_text, n_gram=2)
@@ -106,7 +109,7 @@ class RhetoricAnalyzerAgent:
 
         return phrase_analysis
 
-    def _analyze_tone_shift(self, articles: List[Article]) -> Dict[str, Any]:
+    def _analyze_tone_shift(self, articles: List[Article], texts: List[str]) -> Dict[str, Any]:
         """Detect shifts in tone between early and recent articles"""
         if len(articles) < 2:
             return {
@@ -122,8 +125,8 @@ class RhetoricAnalyzerAgent:
         recent_articles = articles[mid_point:]
 
         # Compare rhetoric
-        early_texts = [f"{a.title} {a.description or ''}" for a in early_articles]
-        recent_texts = [f"{a.title} {a.description or ''}" for a in recent_articles]
+        early_texts = texts[:mid_point]
+        recent_texts = texts[mid_point:]
 
         comparison = self.nlp.compare_rhetoric(early_texts, recent_texts)
 
@@ -166,58 +169,65 @@ class RhetoricAnalyzerAgent:
             'dropped_keywords': comparison['dropped_keywords'][:5]
         }
 
-    def _find_urgency_indicators(self, articles: List[Article]) -> List[str]:
+    def _find_urgency_indicators(self, texts: List[str]) -> List[str]:
         """Find urgency indicators across all articles"""
         all_indicators = set()
 
-        for article in articles:
-            text = f"{article.title} {article.description or ''}"
-            indicators = self.nlp.detect_urgency_indicators(text)
+        for indicators in self._urgency_indicators_batch(texts):
             all_indicators.update(indicators)
 
         return list(all_indicators)
 
-    def _track_actor_mentions(self, articles: List[Article]) -> Dict[str, int]:
+    def _track_actor_mentions(self, texts: List[str]) -> Dict[str, int]:
         """Track mentions of key actors (countries, leaders, organizations)"""
-        all_entities = {
-            'countries': [],
-            'leaders': [],
-            'organizations': []
-        }
+        entities_list = self._entities_batch(texts)
 
-        for article in articles:
-            text = f"{article.title} {article.description or ''}"
-            entities = self.nlp.extract_entities(text)
+        # Count category by category so ties keep the countries, leaders, organizations order
+        actor_counts = Counter()
+        for category in ('countries', 'leaders', 'organizations'):
+            actor_counts.update(chain.from_iterable(entities.get(category, []) for entities in entities_list))
 
-            for category in all_entities:
-                all_entities[category].extend(entities.get(category, []))
+        # Return sorted by frequency
+        return dict(actor_counts.most_common())
 
-        # Count all actors
-        actor_counts = defaultdict(int)
-        for category, actors in all_entities.items():
-            for actor in actors:
-                actor_counts[actor] += 1
+    @staticmethod
+    def _article_texts(articles: List[Article]) -> List[str]:
+        """Title and description of each article, as analyzed by the NLP steps"""
+        return [f"{a.title} {a.description or ''}" for a in articles]
 
-        # Return sorted by frequency
-        return dict(sorted(actor_counts.items(), key=lambda x: x[1], reverse=True))
+    def _urgency_indicators_batch(self, texts: List[str]) -> List[Tuple[str, ...]]:
+        """Urgency indicators per text; uncached texts are detected in one batch"""
+        missing = [text for text in dict.fromkeys(texts) if text not in self._urgency_cache]
+        if missing:
+            detected = self.nlp.detect_urgency_indicators_batch(missing)
+            self._urgency_cache.update(zip(missing, map(tuple, detected)))
+
+        return [self._urgency_cache[text] for text in texts]
+
+    def _entities_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """Entities per text; uncached texts are extracted in one batch"""
+        missing = [text for text in dict.fromkeys(texts) if text not in self._entity_cache]
+        if missing:
+            self._entity_cache.update(zip(missing, self.nlp.extract_entities_batch(missing)))
+
+        return [self._entity_cache[text] for text in texts]
 
     def _analyze_linguistic_features(self, articles: List[Article]) -> Dict[str, Any]:
-        """Analyze various linguistic features"""
+        """Analyze various linguistic features of date-sorted articles"""
         # Title length analysis
-        title_lengths = [len(a.title.split()) for a in articles]
+        title_lengths = np.fromiter((len(a.title.split()) for a in articles), dtype=np.int64, count=len(articles))
 
         # Source diversity
         sources = set(a.source for a in articles)
 
-        # Temporal distribution
-        dates = [a.published_at for a in articles]
-        if dates:
-            time_span = (max(dates) - min(dates)).days
+        # Temporal distribution (articles arrive sorted by date)
+        if articles:
+            time_span = (articles[-1].published_at - articles[0].published_at).days
         else:
             time_span = 0
 
         return {
-            'avg_title_length': np.mean(title_lengths) if title_lengths else 0,
+            'avg_title_length': title_lengths.mean() if title_lengths.size else 0,
             'source_diversity': len(sources),
             'time_span_days': time_span,
             'article_frequency': len(articles) / max(1, time_span),
@@ -264,7 +274,7 @@ class RhetoricAnalyzerAgent:
         # Sentiment trend
         if len(sentiment_trend) > 1:
             recent_sentiments = [s['sentiment_score'] for s in sentiment_trend[-5:]]
-            avg_recent = np.mean(recent_sentiments)
+            avg_recent = sum(recent_sentiments) / len(recent_sentiments)
 
             if avg_recent < -0.2:
                 narrative_parts.append("Recent coverage has been predominantly negative.")
@@ -285,7 +295,9 @@ class RhetoricAnalyzerAgent:
             'sentiment_summary': {}
         }
 
-        cluster_metrics = []
+        # Extremes are tracked in the same pass; ties keep the first cluster, as min/max would
+        sentiments = []
+        most_negative = most_positive = most_urgent = most_active = None
 
         for cluster in clusters:
             avg_sentiment = np.mean([
@@ -294,38 +306,33 @@ class RhetoricAnalyzerAgent:
             ])
 
             # Count urgency indicators
-            urgency_count = 0
-            for article in cluster.articles:
-                text = f"{article.title} {article.description or ''}"
-                urgency_count += len(self.nlp.detect_urgency_indicators(text))
-
-            cluster_metrics.append({
-                'cluster': cluster,
-                'avg_sentiment': avg_sentiment,
-                'urgency_count': urgency_count,
-                'article_count': cluster.article_count
-            })
-
-        if cluster_metrics:
-            # Find extremes
-            comparisons['most_negative'] = min(
-                cluster_metrics, key=lambda x: x['avg_sentiment']
-            )['cluster'].event_name
-
-            comparisons['most_positive'] = max(
-                cluster_metrics, key=lambda x: x['avg_sentiment']
-            )['cluster'].event_name
-
-            comparisons['most_urgent'] = max(
-                cluster_metrics, key=lambda x: x['urgency_count']
-            )['cluster'].event_name
-
-            comparisons['most_active'] = max(
-                cluster_metrics, key=lambda x: x['article_count']
-            )['cluster'].event_name
+            texts = self._article_texts(cluster.articles)
+            urgency_count = sum(len(indicators) for indicators in self._urgency_indicators_batch(texts))
+
+            if most_negative is None:
+                most_negative = most_positive = (avg_sentiment, cluster)
+                most_urgent = (urgency_count, cluster)
+                most_active = (cluster.article_count, cluster)
+            else:
+                if avg_sentiment < most_negative[0]:
+                    most_negative = (avg_sentiment, cluster)
+                if avg_sentiment > most_positive[0]:
+                    most_positive = (avg_sentiment, cluster)
+                if urgency_count > most_urgent[0]:
+                    most_urgent = (urgency_count, cluster)
+                if cluster.article_count > most_active[0]:
+                    most_active = (cluster.article_count, cluster)
+
+            sentiments.append(avg_sentiment)
+
+        if sentiments:
+            comparisons['most_negative'] = most_negative[1].event_name
+            comparisons['most_positive'] = most_positive[1].event_name
+            comparisons['most_urgent'] = most_urgent[1].event_name
+            comparisons['most_active'] = most_active[1].event_name
 
             # Overall sentiment
-            overall_sentiment = np.mean([m['avg_sentiment'] for m in cluster_metrics])
+            overall_sentiment = np.mean(sentiments)
             comparisons['sentiment_summary']['overall'] = overall_sentiment
             comparisons['sentiment_summary']['interpretation'] = (
                 'negative' if overall_sentiment < -0.1
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Article(BaseModel):
@@ -35,12 +36,40 @@ class ArticleCluster(BaseModel):
     last_updated: datetime
     article_count: int
 
+    # Unit-length float32 copy of centroid_embedding, paired with the list it was built from
+    _centroid_unit: Optional[Tuple[List[float], np.ndarray]] = PrivateAttr(default=None)
+
+    @property
+    def centroid_unit(self) -> Optional[np.ndarray]:
+        """L2-normalized float32 centroid, recomputed only when centroid_embedding is replaced"""
+        if not self.centroid_embedding:
+            return None
+
+        if self._centroid_unit is None or self._centroid_unit[0] is not self.centroid_embedding:
+            centroid = np.asarray(self.centroid_embedding, dtype=np.float32)
+            norm = np.linalg.norm(centroid)
+            unit = centroid / norm if norm != 0 else np.zeros_like(centroid)
+            self._centroid_unit = (self.centroid_embedding, unit)
+
+        return self._centroid_unit[1]
+
     def add_article(self, article: Article):
         """Add an article to the cluster"""
         self.articles.append(article)
         self.article_count = len(self.articles)
         self.last_updated = datetime.now()
 
+    def add_articles(self, articles: List[Article]):
+        """Add several articles at once, moving the centroid by an incremental mean"""
+        embeddings = [a.embedding for a in articles if a.embedding]
+        if embeddings and self.centroid_embedding:
+            total = np.asarray(self.centroid_embedding) * self.article_count + np.sum(embeddings, axis=0)
+            self.centroid_embedding = (total / (self.article_count + len(embeddings))).tolist()
+
+        self.articles.extend(articles)
+        self.article_count = len(self.articles)
+        self.last_updated = datetime.now()
+
 
 class RhetoricAnalysis(BaseModel):
     """Model for rhetoric analysis of a cluster over time"""
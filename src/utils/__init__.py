@@ -1,5 +1,6 @@
 from .storage import DataStorage
 from .nlp_utils import NLPProcessor
 from .translator import Translator
+from .cache_store import CacheStore
 
-__all__ = ['DataStorage', 'NLPProcessor', 'Translator']
+__all__ = ['DataStorage', 'NLPProcessor', 'Translator', 'CacheStore']
@@ -0,0 +1,97 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# A cached value: text (e.g. JSON or a translation) and/or raw bytes
+Entry = Tuple[Optional[str], Optional[bytes]]
+
+# SQLite limits the number of ? parameters in one statement
+_MAX_QUERY_KEYS = 500
+
+
+class CacheStore:
+    """SQLite file that keeps results across runs, one size-bounded table per kind of result
+
+    Reads and writes are best effort: a failing database is reported and
+    treated as a cache miss, never as a pipeline error.
+    """
+
+    def __init__(self, path: str, max_rows: int = 50000):
+        """Open (or create) the cache file
+
+        Args:
+            path: SQLite file to use; parent directories are created
+            max_rows: Rows kept per table; the oldest are dropped beyond this
+        """
+        self.path = path
+        self.max_rows = max_rows
+
+        # One connection shared by the fetch threads, serialized by this lock
+        self._lock = threading.Lock()
+        self._tables = set()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+
+    def _ensure_table(self, table: str) -> None:
+        """Create a table on first use (caller holds the lock)"""
+        if table in self._tables:
+            return
+
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            f"(key TEXT PRIMARY KEY, meta TEXT, data BLOB, stored_at REAL)"
+        )
+        self._db.execute(f"CREATE INDEX IF NOT EXISTS {table}_stored_at ON {table} (stored_at)")
+        self._db.commit()
+        self._tables.add(table)
+
+    def get_many(self, table: str, keys: Iterable[str]) -> Dict[str, Entry]:
+        """Cached entries for the keys that are present"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        if not keys:
+            return found
+
+        try:
+            with self._lock:
+                self._ensure_table(table)
+                for start in range(0, len(keys), _MAX_QUERY_KEYS):
+                    chunk = keys[start:start + _MAX_QUERY_KEYS]
+                    rows = self._db.execute(
+                        f"SELECT key, meta, data FROM {table} WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    found.update((key, (meta, data)) for key, meta, data in rows)
+        except sqlite3.Error as e:
+            print(f"  Cache read failed ({e}); continuing without cached {table}.")
+
+        return found
+
+    def get(self, table: str, key: str) -> Optional[Entry]:
+        """Cached entry for one key, or None"""
+        return self.get_many(table, [key]).get(key)
+
+    def put_many(self, table: str, entries: Dict[str, Entry]) -> None:
+        """Write entries in one transaction, then drop the oldest rows beyond max_rows"""
+        if not entries:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._ensure_table(table)
+                with self._db:
+                    self._db.executemany(
+                        f"INSERT OR REPLACE INTO {table} (key, meta, data, stored_at) VALUES (?, ?, ?, ?)",
+                        [(key, meta, data, now) for key, (meta, data) in entries.items()]
+                    )
+                    self._db.execute(
+                        f"DELETE FROM {table} WHERE key IN "
+                        f"(SELECT key FROM {table} ORDER BY stored_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                        (self.max_rows,)
+                    )
+        except sqlite3.Error as e:
+            print(f"  Cache write failed ({e}); {len(entries)} {table} entries not kept.")
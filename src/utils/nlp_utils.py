@@ -1,22 +1,88 @@
+import math
 import re
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Union
 import numpy as np
 from collections import Counter
 from datetime import datetime
 
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WORD_RE = re.compile(r'\w+')
+
+# All urgency terms in one alternation, so a text is scanned once rather than once per group
+_URGENCY_RE = re.compile(
+    r'\b(?:imminent|urgent|immediate|breaking|crisis|emergency'
+    r'|escalat\w+|intensif\w+'
+    r'|deadline|ultimatum'
+    r'|critical|crucial|vital'
+    r'|now|today|tonight|must)\b'
+)
+
+
+# Common stop words
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can', 'that', 'this',
+    'these', 'those', 'it', 'its', 'he', 'she', 'they', 'them', 'their'
+})
+
+# Sentiment lexicons
+_POSITIVE_WORDS = frozenset({
+    'peace', 'agreement', 'cooperation', 'dialogue', 'resolve', 'support',
+    'alliance', 'positive', 'success', 'progress', 'stability', 'diplomatic'
+})
+
+_NEGATIVE_WORDS = frozenset({
+    'war', 'conflict', 'crisis', 'threat', 'attack', 'violence', 'tension',
+    'dispute', 'sanctions', 'invasion', 'hostility', 'aggression', 'warning',
+    'menacing', 'escalate', 'condemn', 'oppose'
+})
+
+# Common geopolitical entities
+_COUNTRIES = frozenset({
+    'china', 'russia', 'usa', 'america', 'iran', 'israel', 'ukraine',
+    'taiwan', 'india', 'pakistan', 'korea', 'japan', 'germany', 'france',
+    'britain', 'turkey', 'syria', 'iraq', 'afghanistan', 'greenland'
+})
+
+_LEADERS = frozenset({
+    'trump', 'biden', 'xi', 'putin', 'modi', 'macron', 'scholz',
+    'erdogan', 'netanyahu', 'zelensky'
+})
+
+_ORGANIZATIONS = frozenset({
+    'nato', 'un', 'eu', 'brics', 'who', 'wto', 'imf', 'opec'
+})
+
+
+@lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str):
+    """Load a sentence transformer once per process so all processors share the weights"""
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(model_name)
+
+    # SentenceTransformer already picks CUDA when it is available; run it in FP16 there
+    if str(model.device).startswith('cuda'):
+        model.half()
+
+    return model
+
+
 class NLPProcessor:
     """NLP utilities for text processing and analysis"""
 
-    def __init__(self):
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+        self.model_name = model_name
         self.model = None
         self._initialize_model()
 
     def _initialize_model(self):
         """Initialize sentence transformer model (lazy loading)"""
         try:
-            from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.model = _load_sentence_transformer(self.model_name)
         except Exception as e:
             print(f"Warning: Could not load sentence transformer: {e}")
             self.model = None
@@ -33,61 +99,92 @@ class NLPProcessor:
             print(f"Error generating embedding: {e}")
             return None
 
-    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings for multiple texts"""
+    def get_embeddings_batch(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """Get embeddings for multiple texts, encoded in fixed-size micro-batches"""
         if self.model is None:
             return [[] for _ in texts]
 
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            embeddings = self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True,
+                                           show_progress_bar=False)
             return embeddings.tolist()
         except Exception as e:
             print(f"Error generating embeddings: {e}")
             return [[] for _ in texts]
 
-    def cosine_similarity(self, emb1: List[float], emb2: List[float]) -> float:
-        """Calculate cosine similarity between two embeddings"""
-        if not emb1 or not emb2:
+    def cosine_similarity(self, emb1: Union[List[float], np.ndarray],
+                          emb2: Union[List[float], np.ndarray]) -> float:
+        """Calculate cosine similarity between two embeddings (lists or arrays)"""
+        if emb1 is None or emb2 is None or len(emb1) == 0 or len(emb2) == 0:
             return 0.0
 
-        vec1 = np.array(emb1)
-        vec2 = np.array(emb2)
+        # Arrays are used as-is, in their own dtype; lists become float64 arrays
+        vec1 = np.asarray(emb1)
+        vec2 = np.asarray(emb2)
 
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        dot_product = vec1 @ vec2
+        norm1 = math.sqrt(vec1 @ vec1)
+        norm2 = math.sqrt(vec2 @ vec2)
 
         if norm1 == 0 or norm2 == 0:
             return 0.0
 
         return float(dot_product / (norm1 * norm2))
 
+    def normalize_embeddings(self, embeddings: List[List[float]]) -> np.ndarray:
+        """Return embeddings as float32 unit-length rows (zero vectors stay zero)"""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms != 0)
+
+    def cosine_similarity_matrix(self, embs1: List[List[float]],
+                                 embs2: Optional[List[List[float]]] = None) -> np.ndarray:
+        """Calculate all pairwise cosine similarities between two lists of embeddings
+
+        Rows are L2-normalized once and compared with a single float32 matrix
+        product; with embs2 omitted, embs1 is compared with itself and is only
+        normalized once. Zero vectors get a similarity of 0.0, as in
+        cosine_similarity.
+        """
+        mat1 = self.normalize_embeddings(embs1)
+        mat2 = mat1 if embs2 is None else self.normalize_embeddings(embs2)
+
+        return mat1 @ mat2.T
+
     def extract_keywords(self, text: str, top_n: int = 10) -> List[str]:
         """Extract keywords from text using simple frequency analysis"""
+        if not text or text.isspace():
+            return []
+
+        # Count frequencies
+        word_freq = Counter(self._keyword_tokens(text))
+
+        return [word for word, _ in word_freq.most_common(top_n)]
+
+    def extract_keywords_from_texts(self, texts: List[str], top_n: int = 10) -> List[str]:
+        """Extract keywords across several texts without joining them into one string"""
+        word_freq = Counter()
+        for text in texts:
+            word_freq.update(self._keyword_tokens(text))
+
+        return [word for word, _ in word_freq.most_common(top_n)]
+
+    def _keyword_tokens(self, text: str) -> List[str]:
+        """Lowercased candidate keyword tokens of text, stop words removed"""
         # Remove punctuation and convert to lowercase
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-
-        # Common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'must', 'can', 'that', 'this',
-            'these', 'those', 'it', 'its', 'he', 'she', 'they', 'them', 'their'
-        }
+        text = _PUNCTUATION_RE.sub(' ', text.lower())
 
         # Tokenize and filter
         words = text.split()
-        words = [w for w in words if len(w) > 3 and w not in stop_words]
-
-        # Count frequencies
-        word_freq = Counter(words)
+        return [w for w in words if len(w) > 3 and w not in _STOP_WORDS]
 
-        return [word for word, _ in word_freq.most_common(top_n)]
+    def extract_keywords_batch(self, texts: List[str], top_n: int = 10) -> List[List[str]]:
+        """Extract keywords for multiple texts"""
+        return [self.extract_keywords(text, top_n=top_n) for text in texts]
 
     def extract_phrases(self, text: str, n_gram: int = 2) -> List[Tuple[str, int]]:
         """Extract n-gram phrases from text"""
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
+        text = _PUNCTUATION_RE.sub(' ', text.lower())
         words = text.split()
 
         phrases = []
@@ -100,22 +197,14 @@ class NLPProcessor:
 
     def analyze_sentiment_simple(self, text: str) -> float:
         """Simple sentiment analysis using keyword matching"""
-        positive_words = {
-            'peace', 'agreement', 'cooperation', 'dialogue', 'resolve', 'support',
-            'alliance', 'positive', 'success', 'progress', 'stability', 'diplomatic'
-        }
-
-        negative_words = {
-            'war', 'conflict', 'crisis', 'threat', 'attack', 'violence', 'tension',
-            'dispute', 'sanctions', 'invasion', 'hostility', 'aggression', 'warning',
-            'menacing', 'escalate', 'condemn', 'oppose'
-        }
+        if not text or text.isspace():
+            return 0.0
 
         text_lower = text.lower()
-        words = re.findall(r'\w+', text_lower)
+        words = _WORD_RE.findall(text_lower)
 
-        pos_count = sum(1 for word in words if word in positive_words)
-        neg_count = sum(1 for word in words if word in negative_words)
+        pos_count = sum(1 for word in words if word in _POSITIVE_WORDS)
+        neg_count = sum(1 for word in words if word in _NEGATIVE_WORDS)
 
         total = pos_count + neg_count
         if total == 0:
@@ -124,68 +213,37 @@ class NLPProcessor:
         # Return score from -1 (negative) to 1 (positive)
         return (pos_count - neg_count) / total
 
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[float]:
+        """Simple sentiment analysis for multiple texts"""
+        return [self.analyze_sentiment_simple(text) for text in texts]
+
     def detect_urgency_indicators(self, text: str) -> List[str]:
         """Detect urgency indicators in text"""
-        urgency_patterns = [
-            r'\b(imminent|urgent|immediate|breaking|crisis|emergency)\b',
-            r'\b(escalat\w+|intensif\w+)\b',
-            r'\b(deadline|ultimatum)\b',
-            r'\b(critical|crucial|vital)\b',
-            r'\b(now|today|tonight|must)\b'
-        ]
-
-        text_lower = text.lower()
-        indicators = []
-
-        for pattern in urgency_patterns:
-            matches = re.findall(pattern, text_lower)
-            indicators.extend(matches)
+        return list(set(_URGENCY_RE.findall(text.lower())))
 
-        return list(set(indicators))
+    def detect_urgency_indicators_batch(self, texts: List[str]) -> List[List[str]]:
+        """Detect urgency indicators in multiple texts"""
+        return [self.detect_urgency_indicators(text) for text in texts]
 
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Simple entity extraction (countries, leaders, organizations)"""
-        # Common geopolitical entities
-        countries = {
-            'china', 'russia', 'usa', 'america', 'iran', 'israel', 'ukraine',
-            'taiwan', 'india', 'pakistan', 'korea', 'japan', 'germany', 'france',
-            'britain', 'turkey', 'syria', 'iraq', 'afghanistan', 'greenland'
-        }
-
-        leaders = {
-            'trump', 'biden', 'xi', 'putin', 'modi', 'macron', 'scholz',
-            'erdogan', 'netanyahu', 'zelensky'
-        }
-
-        organizations = {
-            'nato', 'un', 'eu', 'brics', 'who', 'wto', 'imf', 'opec'
-        }
-
         text_lower = text.lower()
-        words = set(re.findall(r'\w+', text_lower))
+        words = set(_WORD_RE.findall(text_lower))
 
         return {
-            'countries': [c for c in countries if c in words],
-            'leaders': [l for l in leaders if l in words],
-            'organizations': [o for o in organizations if o in words]
+            'countries': [c for c in _COUNTRIES if c in words],
+            'leaders': [l for l in _LEADERS if l in words],
+            'organizations': [o for o in _ORGANIZATIONS if o in words]
         }
 
+    def extract_entities_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """Entity extraction for multiple texts"""
+        return [self.extract_entities(text) for text in texts]
+
     def compare_rhetoric(self, texts_old: List[str], texts_new: List[str]) -> Dict[str, any]:
         """Compare rhetoric between two time periods"""
-        # Extract keywords from both periods
-        old_text = ' '.join(texts_old)
-        new_text = ' '.join(texts_new)
-
-        old_keywords = set(self.extract_keywords(old_text, top_n=20))
-        new_keywords = set(self.extract_keywords(new_text, top_n=20))
-
-        # Sentiment comparison
-        old_sentiment = np.mean([self.analyze_sentiment_simple(t) for t in texts_old])
-        new_sentiment = np.mean([self.analyze_sentiment_simple(t) for t in texts_new])
-
-        # Urgency comparison
-        old_urgency = sum(len(self.detect_urgency_indicators(t)) for t in texts_old)
-        new_urgency = sum(len(self.detect_urgency_indicators(t)) for t in texts_new)
+        old_sentiment, old_urgency, old_keywords = self._summarize_period(texts_old)
+        new_sentiment, new_urgency, new_keywords = self._summarize_period(texts_new)
 
         return {
             'sentiment_change': float(new_sentiment - old_sentiment),
@@ -194,3 +252,16 @@ class NLPProcessor:
             'dropped_keywords': list(old_keywords - new_keywords),
             'persistent_keywords': list(old_keywords & new_keywords)
         }
+
+    def _summarize_period(self, texts: List[str]) -> Tuple[float, int, set]:
+        """Mean sentiment, urgency indicator count and top-20 keywords of one period's texts"""
+        sentiments = []
+        urgency = 0
+        for text in texts:
+            sentiments.append(self.analyze_sentiment_simple(text))
+            urgency += len(self.detect_urgency_indicators(text))
+
+        # Counted per text, which matches extracting from the texts joined with spaces
+        keywords = set(self.extract_keywords_from_texts(texts, top_n=20))
+
+        return np.mean(sentiments), urgency, keywords
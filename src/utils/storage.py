@@ -1,10 +1,63 @@
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict
+import numpy as np
+from pydantic import TypeAdapter
 from src.models import Article, ArticleCluster, RhetoricAnalysis, EventPrediction
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Serializers for whole lists of models, built once instead of dumping model by model
+_ARTICLES_ADAPTER = TypeAdapter(List[Article])
+_CLUSTERS_ADAPTER = TypeAdapter(List[ArticleCluster])
+_ANALYSES_ADAPTER = TypeAdapter(List[RhetoricAnalysis])
+_PREDICTIONS_ADAPTER = TypeAdapter(List[EventPrediction])
+
+
+def _write_json(filepath: Path, data: Dict) -> None:
+    """Write data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=options))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+
+def _read_json(filepath: Path) -> Dict:
+    """Read a JSON file written by _write_json"""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Batch files are named articles_<YYYYmmdd_HHMMSS>.json unless a custom batch id was given
+_BATCH_FILE_RE = re.compile(r'articles_(\d{8}_\d{6})\.json')
+
+# Allowance for feeds that stamp articles ahead of the local clock (time zones, skew)
+_BATCH_SKEW_SECONDS = 86400
+
+
+def _batch_timestamp(filepath: Path) -> Optional[float]:
+    """When an articles batch was saved, from its file name (None for custom batch ids)"""
+    match = _BATCH_FILE_RE.fullmatch(filepath.name)
+    if match is None:
+        return None
+
+    return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").timestamp()
+
 
 class DataStorage:
     """Handles data persistence for articles, clusters, and analyses"""
@@ -29,11 +82,28 @@ class DataStorage:
             "batch_id": batch_id,
             "timestamp": datetime.now().isoformat(),
             "count": len(articles),
-            "articles": [article.model_dump() for article in articles]
+            "articles": _ARTICLES_ADAPTER.dump_python(articles)
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        # Keep embeddings out of the JSON in a .npy sidecar when they share one dimension
+        embeddings = [article.embedding for article in articles if article.embedding]
+        if embeddings and len({len(embedding) for embedding in embeddings}) == 1:
+            embeddings_path = filepath.with_suffix('.npy')
+            np.save(embeddings_path, np.asarray(embeddings, dtype=np.float32))
+
+            rows = []
+            next_row = 0
+            for row in data['articles']:
+                if row['embedding']:
+                    rows.append(next_row)
+                    row['embedding'] = None
+                    next_row += 1
+                else:
+                    rows.append(None)
+
+            data['embeddings'] = {"file": embeddings_path.name, "rows": rows}
+
+        _write_json(filepath, data)
 
         return batch_id
 
@@ -48,29 +118,61 @@ class DataStorage:
                 return []
             filepath = files[-1]
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        return [Article(**article) for article in data['articles']]
+        return self._read_articles(filepath)
+
+    def _read_articles(self, filepath: Path) -> List[Article]:
+        """Read an articles batch file, restoring embeddings from its .npy sidecar if it has one"""
+        data = _read_json(filepath)
+        rows = data['articles']
+
+        # Batches saved before sidecars existed keep their embeddings inline; a
+        # missing sidecar leaves the embeddings as stored in the JSON (None)
+        embeddings = data.get('embeddings')
+        embeddings_path = filepath.with_name(embeddings['file']) if embeddings else None
+        if embeddings_path is not None and embeddings_path.is_file():
+            matrix = np.load(embeddings_path, mmap_mode='r')
+            for row, index in zip(rows, embeddings['rows']):
+                if index is not None:
+                    row['embedding'] = matrix[index].tolist()
+        elif embeddings_path is not None:
+            print(f"⚠️  Embeddings file {embeddings_path.name} not found; loading {filepath.name} without embeddings")
+
+        # These rows were written by save_articles from validated models, so they are
+        # rebuilt without re-validation; only the timestamp needs converting back
+        articles = []
+        for row in rows:
+            row['published_at'] = datetime.fromisoformat(row['published_at'])
+            articles.append(Article.model_construct(**row))
+
+        return articles
 
     def load_all_articles(self, days: Optional[int] = None) -> List[Article]:
         """Load all articles, optionally filtered by days"""
-        all_articles = []
         files = sorted(self.raw_path.glob("articles_*.json"))
+        cutoff = datetime.now().timestamp() - (days * 86400) if days else None
 
-        for filepath in files:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                articles = [Article(**article) for article in data['articles']]
+        # A batch cannot hold articles published after it was saved, so batches
+        # saved well before the cutoff are skipped without being read
+        if cutoff is not None:
+            oldest_batch = cutoff - _BATCH_SKEW_SECONDS
+            files = [
+                f for f in files
+                if _batch_timestamp(f) is None or _batch_timestamp(f) >= oldest_batch
+            ]
 
-                if days:
-                    cutoff = datetime.now().timestamp() - (days * 86400)
-                    articles = [
-                        a for a in articles
-                        if a.published_at.timestamp() > cutoff
-                    ]
+        # Batch files are read concurrently; results are kept in file order
+        with ThreadPoolExecutor(max_workers=min(8, len(files)) or 1) as executor:
+            batches = list(executor.map(self._read_articles, files))
 
-                all_articles.extend(articles)
+        all_articles = []
+        for articles in batches:
+            if cutoff is not None:
+                articles = [
+                    a for a in articles
+                    if a.published_at.timestamp() > cutoff
+                ]
+
+            all_articles.extend(articles)
 
         return all_articles
 
@@ -83,11 +185,10 @@ class DataStorage:
         data = {
             "timestamp": datetime.now().isoformat(),
             "count": len(clusters),
-            "clusters": [cluster.model_dump() for cluster in clusters]
+            "clusters": _CLUSTERS_ADAPTER.dump_python(clusters)
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        _write_json(filepath, data)
 
         return timestamp
 
@@ -101,8 +202,7 @@ class DataStorage:
                 return []
             filepath = files[-1]
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
 
         return [ArticleCluster(**cluster) for cluster in data['clusters']]
 
@@ -110,8 +210,20 @@ class DataStorage:
         """Save rhetoric analysis"""
         filepath = self.analysis_path / f"analysis_{analysis.cluster_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(analysis.model_dump(), f, indent=2, ensure_ascii=False, default=str)
+        _write_json(filepath, analysis.model_dump())
+
+    def save_analyses(self, analyses: List[RhetoricAnalysis]) -> None:
+        """Save several rhetoric analyses in a single file"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = self.analysis_path / f"analyses_{timestamp}.json"
+
+        data = {
+            "timestamp": datetime.now().isoformat(),
+            "count": len(analyses),
+            "analyses": _ANALYSES_ADAPTER.dump_python(analyses)
+        }
+
+        _write_json(filepath, data)
 
     def save_predictions(self, predictions: List[EventPrediction]) -> None:
         """Save event predictions"""
@@ -120,11 +232,10 @@ class DataStorage:
 
         data = {
             "timestamp": datetime.now().isoformat(),
-            "predictions": [pred.model_dump() for pred in predictions]
+            "predictions": _PREDICTIONS_ADAPTER.dump_python(predictions)
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        _write_json(filepath, data)
 
     def get_latest_predictions(self) -> List[EventPrediction]:
         """Load most recent predictions"""
@@ -132,7 +243,6 @@ class DataStorage:
         if not files:
             return []
 
-        with open(files[-1], 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(files[-1])
 
         return [EventPrediction(**pred) for pred in data['predictions']]
@@ -1,13 +1,106 @@
-from typing import Optional
-from deep_translator import GoogleTranslator
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from deep_translator import GoogleTranslator, single_detection
+from .cache_store import CacheStore
+
+# Words common in English headlines that are not also words in the feeds' other languages
+# (so no 'is', 'was', 'over', 'will' (German) or 'of', 'to' (Dutch))
+_ENGLISH_MARKERS = frozenset({
+    'the', 'and', 'with', 'from', 'after', 'says', 'amid', 'against', 'their', 'been', 'have'
+})
+_ASCII_WORD_RE = re.compile(r"[a-z]+")
+
+# New translations are written to the cache store in batches of this size
+_STORE_BATCH_SIZE = 64
+
+
+def _looks_english(text: str) -> bool:
+    """Cheap local check: almost all ASCII and containing an English function word"""
+    if len(text.encode('ascii', 'ignore')) <= 0.95 * len(text):
+        return False
+
+    return not _ENGLISH_MARKERS.isdisjoint(_ASCII_WORD_RE.findall(text.lower()))
 
 
 class Translator:
     """Utility for translating text from various languages to English"""
 
-    def __init__(self):
-        """Initialize the translator with Google Translate (free)"""
-        self.translator = GoogleTranslator(source='auto', target='en')
+    def __init__(self, cache_size: int = 4096, store: Optional[CacheStore] = None):
+        """Initialize the translator with Google Translate (free)
+
+        Args:
+            cache_size: Number of recent translations/detections kept in memory
+            store: Optional cache store that keeps translations across runs;
+                   new translations reach it in batches and on flush()
+        """
+        # GoogleTranslator keeps per-request state, so each thread gets its own
+        # instances, kept per source language for mixed-language streams
+        self._local = threading.local()
+
+        # Syndicated feeds repeat the same text, so keep recent successful results (LRU)
+        self.cache_size = cache_size
+        self._translations: OrderedDict = OrderedDict()
+        self._languages: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Translations not yet written to the store, flushed in batches outside the LRU lock
+        self.store = store
+        self._pending: Dict[str, str] = {}
+
+    def _cache_get(self, cache: OrderedDict, key):
+        """Return a cached value (None if missing) and mark it as recently used"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key, value) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    @staticmethod
+    def _store_key(source_lang: str, text: str) -> str:
+        """Cache store key of a translation"""
+        return f"{source_lang}:{text}"
+
+    def _stored_translations(self, source_lang: str, texts: List[str]) -> Dict[str, str]:
+        """Translations saved by earlier runs, if there is a cache store"""
+        if self.store is None:
+            return {}
+
+        keys = {self._store_key(source_lang, text): text for text in texts}
+        entries = self.store.get_many('translations', keys)
+        return {keys[key]: meta for key, (meta, _) in entries.items() if meta is not None}
+
+    def _store_translation(self, source_lang: str, text: str, translated: str) -> None:
+        """Queue a translation for the cache store, writing a full batch at once"""
+        if self.store is None:
+            return
+
+        with self._cache_lock:
+            self._pending[self._store_key(source_lang, text)] = translated
+            batch_full = len(self._pending) >= _STORE_BATCH_SIZE
+
+        if batch_full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write queued translations to the cache store in one transaction (call when done)"""
+        if self.store is None:
+            return
+
+        with self._cache_lock:
+            pending, self._pending = self._pending, {}
+
+        self.store.put_many('translations', {key: (translated, None) for key, translated in pending.items()})
 
     def translate_to_english(self, text: str, source_lang: str = 'auto') -> Optional[str]:
         """
@@ -25,19 +118,117 @@ class Translator:
         if not text or not text.strip():
             return text
 
-        try:
-            # Update source language if specified
-            if source_lang != self.translator.source:
-                self.translator = GoogleTranslator(source=source_lang, target='en')
+        cached = self._cache_get(self._translations, (source_lang, text))
+        if cached is not None:
+            return cached
+
+        stored = self._stored_translations(source_lang, [text]).get(text)
+        if stored is not None:
+            self._cache_put(self._translations, (source_lang, text), stored)
+            return stored
 
+        try:
             # Translate text
-            translated = self.translator.translate(text)
+            translated = self._get_translator(source_lang).translate(text)
+            if translated is not None:
+                self._cache_put(self._translations, (source_lang, text), translated)
+                self._store_translation(source_lang, text, translated)
             return translated
 
         except Exception as e:
             print(f"  Translation error: {e}. Returning original text.")
             return text
 
+    def translate_many(self, texts: List[str], source_lang: str = 'auto',
+                       batch_size: int = 50) -> List[Optional[str]]:
+        """
+        Translate several texts to English, sending only uncached texts
+
+        Args:
+            texts: Texts to translate; empty texts are returned unchanged
+            source_lang: Source language code (default 'auto' for auto-detection)
+            batch_size: Number of texts handed to the translator per batch
+
+        Returns:
+            Translations in the order of texts (original text where translation fails)
+        """
+        results = {}
+        uncached = []
+        for text in dict.fromkeys(texts):
+            if not text or not text.strip():
+                results[text] = text
+                continue
+
+            cached = self._cache_get(self._translations, (source_lang, text))
+            if cached is None:
+                uncached.append(text)
+            else:
+                results[text] = cached
+
+        # Texts missing from memory are looked up in the store in one query
+        stored = self._stored_translations(source_lang, uncached)
+        for text, translated in stored.items():
+            self._cache_put(self._translations, (source_lang, text), translated)
+        results.update(stored)
+        missing = [text for text in uncached if text not in stored]
+
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start:start + batch_size]
+            try:
+                translated = self._get_translator(source_lang).translate_batch(chunk)
+            except Exception as e:
+                # One bad text fails the whole batch; retry item by item (these cache themselves)
+                print(f"  Batch translation error: {e}. Translating individually.")
+                results.update((text, self.translate_to_english(text, source_lang) or text) for text in chunk)
+                continue
+
+            for text, result in zip(chunk, translated):
+                if result is None:
+                    results[text] = text
+                    continue
+
+                self._cache_put(self._translations, (source_lang, text), result)
+                self._store_translation(source_lang, text, result)
+                results[text] = result
+
+        return [results[text] for text in texts]
+
+    def translate_many_parallel(self, texts: List[str], source_lang: str = 'auto',
+                                max_workers: int = 16) -> List[Optional[str]]:
+        """
+        Translate several texts to English with concurrent requests
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code (default 'auto' for auto-detection)
+            max_workers: Maximum number of translations in flight at once
+
+        Returns:
+            Translations in the order of texts (original text where translation fails)
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if not unique_texts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_texts))) as executor:
+            translated = dict(zip(
+                unique_texts,
+                executor.map(lambda text: self.translate_to_english(text, source_lang), unique_texts)
+            ))
+
+        return [translated[text] for text in texts]
+
+    def _get_translator(self, source_lang: str) -> GoogleTranslator:
+        """This thread's translator for source_lang, created once per language"""
+        translators = getattr(self._local, 'translators', None)
+        if translators is None:
+            translators = self._local.translators = {}
+
+        translator = translators.get(source_lang)
+        if translator is None:
+            translator = translators[source_lang] = GoogleTranslator(source=source_lang, target='en')
+        return translator
+
     def detect_language(self, text: str) -> Optional[str]:
         """
         Detect the language of the given text
@@ -48,9 +239,14 @@ class Translator:
         Returns:
             Language code (e.g., 'en', 'zh-CN', 'de', 'fr')
         """
+        cached = self._cache_get(self._languages, text)
+        if cached is not None:
+            return cached
+
         try:
-            from deep_translator import single_detection
             lang = single_detection(text, api_key=None)
+            if lang:
+                self._cache_put(self._languages, text, lang)
             return lang
         except Exception as e:
             print(f"  Language detection error: {e}")
@@ -69,5 +265,9 @@ class Translator:
         if not text:
             return True
 
+        # Plain English headlines are settled locally; anything else is detected remotely
+        if _looks_english(text):
+            return True
+
         lang = self.detect_language(text)
         return lang == 'en' if lang else True
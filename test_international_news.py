@@ -5,6 +5,7 @@ Test script for international news aggregation
 
 import os
 import sys
+import traceback
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -37,6 +38,7 @@ def test_international_news():
 
     try:
         articles = aggregator._fetch_from_rss_feeds(days_back=3, max_articles_per_feed=5)
+        aggregator._enrich_articles(articles)
 
         print()
         print("=" * 70)
@@ -52,17 +54,21 @@ def test_international_news():
                     sources[article.source] = []
                 sources[article.source].append(article)
 
-            print("📰 Sample articles by source:")
-            print()
+            # The sample listing is built as lines and written to stdout at once
+            lines = ["📰 Sample articles by source:", ""]
 
             for source_name, source_articles in sorted(sources.items()):
-                print(f"  {source_name} ({len(source_articles)} articles):")
+                lines.append(f"  {source_name} ({len(source_articles)} articles):")
                 for article in source_articles[:2]:  # Show first 2 from each source
-                    print(f"    • {article.title[:80]}{'...' if len(article.title) > 80 else ''}")
-                    print(f"      Published: {article.published_at.strftime('%Y-%m-%d %H:%M')}")
-                    print(f"      URL: {article.url[:70]}...")
-                    print(f"      Sentiment: {article.sentiment_score:.2f}")
-                print()
+                    title = article.title
+                    lines.append(f"    • {title[:80]}{'...' if len(title) > 80 else ''}")
+                    lines.append(f"      Published: {article.published_at.strftime('%Y-%m-%d %H:%M')}")
+                    lines.append(f"      URL: {article.url[:70]}...")
+                    lines.append(f"      Sentiment: {article.sentiment_score:.2f}")
+                lines.append("")
+
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
             print("=" * 70)
             print("✅ International news collection is working correctly!")
@@ -76,7 +82,6 @@ def test_international_news():
 
     except Exception as e:
         print(f"❌ Error during testing: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -97,6 +97,65 @@ def test_python_syntax():
     return all_valid
 
 
+def test_article_storage_round_trip():
+    """Test that saved articles load back with their embeddings and publish dates"""
+    import json
+    import tempfile
+    from datetime import datetime
+
+    print("\nTesting article storage round trip...")
+    try:
+        from src.models import Article
+        from src.utils.storage import DataStorage
+    except ImportError as e:
+        print(f"  ⚠️  Skipped, dependencies not installed ({e})")
+        return True
+
+    published = [datetime(2024, 1, 15, 8, 30), datetime(2024, 1, 16, 21, 5, 42)]
+    articles = [
+        Article(id='a1', title='Summit opens', url='https://example.com/1', source='Example',
+                published_at=published[0], embedding=[0.5, -0.25, 1.0]),
+        Article(id='a2', title='Talks stall', url='https://example.com/2', source='Example',
+                published_at=published[1], embedding=None),
+    ]
+
+    all_correct = True
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = DataStorage(tmp)
+
+        loaded = storage.load_articles(storage.save_articles(articles, batch_id='roundtrip'))
+        correct = [a.embedding for a in loaded] == [[0.5, -0.25, 1.0], None]
+        print(f"  {'✅' if correct else '❌'} embeddings restored from sidecar")
+        all_correct = all_correct and correct
+
+        correct = [a.published_at for a in loaded] == published
+        print(f"  {'✅' if correct else '❌'} published_at restored")
+        all_correct = all_correct and correct
+
+        # A batch written before sidecars existed keeps its embeddings inline
+        legacy = {
+            "batch_id": "legacy",
+            "count": 1,
+            "articles": [articles[0].model_dump(mode='json')]
+        }
+        with open(os.path.join(tmp, 'raw', 'articles_legacy.json'), 'w', encoding='utf-8') as f:
+            json.dump(legacy, f)
+
+        loaded = storage.load_articles('legacy')
+        correct = loaded[0].embedding == [0.5, -0.25, 1.0] and loaded[0].published_at == published[0]
+        print(f"  {'✅' if correct else '❌'} inline embeddings of older batches")
+        all_correct = all_correct and correct
+
+        # A batch whose sidecar went missing still loads, without embeddings
+        os.remove(os.path.join(tmp, 'raw', 'articles_roundtrip.npy'))
+        loaded = storage.load_articles('roundtrip')
+        correct = [a.embedding for a in loaded] == [None, None]
+        print(f"  {'✅' if correct else '❌'} missing sidecar falls back to no embeddings")
+        all_correct = all_correct and correct
+
+    return all_correct
+
+
 def main():
     print("="*60)
     print("World News Analysis System - Structure Test")
@@ -108,6 +167,7 @@ def main():
     results.append(("Directory Structure", test_directory_structure()))
     results.append(("Required Files", test_required_files()))
     results.append(("Python Syntax", test_python_syntax()))
+    results.append(("Article Storage", test_article_storage_round_trip()))
 
     print("\n" + "="*60)
     print("Test Results Summary")
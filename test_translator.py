@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the translator's local English check (no network needed)
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.utils.translator import Translator, _looks_english
+
+
+def test_local_english_check():
+    """Test that only English titles skip remote language detection"""
+    cases = [
+        ("Putin says talks with Kyiv are over", True),
+        ("EU leaders meet amid trade dispute", True),
+        ("Was Trump von Grönland will", False),  # German
+        ("Het kabinet is gevallen na ruzie over asiel", False),  # Dutch
+    ]
+
+    print("Testing local English check...")
+    all_correct = True
+    for title, expected in cases:
+        correct = _looks_english(title) == expected
+        status = "✅" if correct else "❌"
+        print(f"  {status} {title}")
+        all_correct = all_correct and correct
+
+    return all_correct
+
+
+def test_non_english_titles_are_detected():
+    """Test that German and Dutch titles fall through to language detection"""
+    translator = Translator()
+    detected = []
+
+    def detect_language(text):
+        detected.append(text)
+        return 'de' if text.startswith('Was') else 'nl'
+
+    translator.detect_language = detect_language
+
+    titles = ["Was Trump von Grönland will", "Het kabinet is gevallen na ruzie over asiel"]
+
+    print("\nTesting language detection fallback...")
+    all_correct = True
+    for title in titles:
+        correct = not translator.is_english(title) and title in detected
+        status = "✅" if correct else "❌"
+        print(f"  {status} {title}")
+        all_correct = all_correct and correct
+
+    return all_correct
+
+
+def main():
+    print("=" * 60)
+    print("Translator Test")
+    print("=" * 60)
+    print()
+
+    results = [
+        test_local_english_check(),
+        test_non_english_titles_are_detected(),
+    ]
+
+    print()
+    if all(results):
+        print("✅ All translator tests passed!")
+        return 0
+
+    print("❌ Some translator tests failed. Please check the errors above.")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())